@@ -1,4 +1,4 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks, Request
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks, Request, Response
 from typing import List, Optional, Dict
 import uuid
 import os
@@ -12,6 +12,7 @@ from app.services.workflow_manager import WorkflowManager
 from app.services.parallel_workflow_manager import ParallelWorkflowManager
 from app.services.task_queue import task_queue
 import json
+import hashlib
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -281,10 +282,14 @@ async def generate_fashion(
         )
 
 @router.get("/files/{request_id}", response_model=FileAccessResponse)
-async def get_files_by_request_id(request_id: str):
+async def get_files_by_request_id(request_id: str, request: Request, response: Response):
     """
     Retrieve all files associated with a specific request_id.
     
+    The response carries a strong ETag derived from the file listing. Clients
+    that send it back in If-None-Match get an empty 304 when nothing has
+    changed; weak (W/) tags, comma-separated lists and "*" are accepted.
+    
     Args:
         request_id: The unique identifier for the generation request
         
@@ -352,17 +357,44 @@ async def get_files_by_request_id(request_id: str):
         if not files:
             raise HTTPException(status_code=404, detail="No files found for this request_id")
         
-        return {
+        result = {
             "request_id": request_id,
             "files": files,
             "count": len(files)
         }
         
+        etag = '"' + hashlib.md5(json.dumps(result, sort_keys=True).encode()).hexdigest() + '"'
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
+        return result
+        
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving files: {str(e)}")
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+    
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match: a W/
+    prefix is ignored, any tag in a comma-separated list may match, and "*"
+    matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
 def get_file_type(filename: str) -> str:
     """Determine file type based on extension."""
     ext = filename.lower().split('.')[-1] if '.' in filename else ''
@@ -9,6 +9,7 @@ import logging
 import os
 import json
 import re
+from functools import lru_cache
 from io import BytesIO
 from PIL import Image
 
@@ -21,6 +22,147 @@ if settings.USE_GEMINI_FOR_IMAGES or settings.USE_GEMINI_FOR_VIDEOS:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Specialized prompt for jeans with distressing details
+JEANS_PROMPT_TEMPLATE = """
+Professional high-fashion photography of a single {model_type} model wearing the exact pair of jeans shown in the reference images, positioned in a {background}.
+
+PHOTOGRAPHY DIRECTIVES:
+- Show ONLY ONE person in the image with professional studio lighting
+- Generate image with {aspect_description}
+- The background MUST completely fill the frame with no white borders or margins
+
+CRITICALLY IMPORTANT: The generated image MUST show the EXACT SAME pair of jeans as in the reference images. Do NOT modify, change, or alter the jeans in any way.
+
+The model MUST be wearing the identical jeans from the reference images with no changes to:
+  * Color, material, and design
+  * All distressing details (rips, tears, fading, whiskering, etc.)
+  * Specific distressing locations (knee tears, thigh rips, pocket wear, etc.)
+  * Fit and silhouette (skinny, straight, tapered, etc.)
+  * Wash type (dark, medium, light, black, etc.)
+  * Hardware details (buttons, rivets, zippers, etc.)
+  * Stitching patterns and thread color
+  * All visual elements and styling
+
+Use the reference images as the absolute source of truth for the jeans appearance.
+
+POSE AND MODEL SPECIFICATIONS:
+- Position model {pose}
+- {model_type_title} with professional runway modeling posture
+- Natural, confident facial expression with subtle smile
+- Perfect body proportions and professional posing
+- Skin tone and features appropriate for the {model_type} specification
+- No duplicate or repeated figures in the composition
+
+BACKGROUND AND LIGHTING:
+- Background seamlessly extends to all edges of the image frame
+- Lighting matches the environment (natural for outdoor, studio for indoor)
+- Shadows and reflections consistent with the scene
+- Professional fashion editorial quality throughout
+
+CRITICAL RESTRICTIONS FOR JEANS WITH DISTRESSING:
+- DO NOT reinterpret or redesign the distressing pattern in any way
+- DO NOT change the location, size, or shape of any rips or tears
+- DO NOT add or remove any distressing details
+- DO NOT modify the wash pattern or fading effects
+- The jeans shown MUST be IDENTICAL to the reference images in ALL visual aspects
+- Focus ONLY on the background setting and model pose, not on jeans modification
+
+ASPECT RATIO ENFORCEMENT:
+- CRITICALLY IMPORTANT: Generate the image with EXACTLY {aspect_ratio} aspect ratio
+- DO NOT crop, stretch, or distort the image in any way
+- Ensure the composition fits perfectly within the {aspect_ratio} frame
+- Maintain all visual elements and proportions as specified
+"""
+
+# Standard prompt for other products
+STANDARD_PROMPT_TEMPLATE = """
+Professional high-fashion photography of a single {model_type} model wearing the exact product shown in the reference images, positioned in a {background}.
+
+PHOTOGRAPHY DIRECTIVES:
+- Show ONLY ONE person in the image with professional studio lighting
+- Generate image with {aspect_description}
+- The background MUST completely fill the frame with no white borders or margins
+
+CRITICALLY IMPORTANT: The generated image MUST show the EXACT SAME product as in the reference images. Do NOT modify, change, or alter the product in any way.
+
+The model MUST be wearing the identical product from the reference images with no changes to:
+  * Color, material, and design
+  * All design details (neckline, sleeves, hemline, patterns, textures)
+  * Fit and silhouette
+  * Length and proportions
+  * All visual elements and styling
+
+Use the reference images as the absolute source of truth for the product appearance.
+
+POSE AND MODEL SPECIFICATIONS:
+- Position model {pose}
+- {model_type_title} with professional runway modeling posture
+- Natural, confident facial expression with subtle smile
+- Perfect body proportions and professional posing
+- Skin tone and features appropriate for the {model_type} specification
+- No duplicate or repeated figures in the composition
+
+BACKGROUND AND LIGHTING:
+- Background seamlessly extends to all edges of the image frame
+- Lighting matches the environment (natural for outdoor, studio for indoor)
+- Shadows and reflections consistent with the scene
+- Professional fashion editorial quality throughout
+
+CRITICAL RESTRICTIONS:
+- DO NOT reinterpret or redesign the product in any way
+- DO NOT change any visual aspects of the product (color, pattern, texture, fit, etc.)
+- DO NOT add or remove any design elements from the product
+- The product shown MUST be IDENTICAL to the reference images in ALL visual aspects
+- Focus ONLY on the background setting and model pose, not on product modification
+
+ASPECT RATIO ENFORCEMENT:
+- CRITICALLY IMPORTANT: Generate the image with EXACTLY {aspect_ratio} aspect ratio
+- DO NOT crop, stretch, or distort the image in any way
+- Ensure the composition fits perfectly within the {aspect_ratio} frame
+- Maintain all visual elements and proportions as specified
+"""
+
+# Description keywords that select the specialized jeans prompt
+_JEANS_KEYWORDS = ("jeans", "denim")
+_DISTRESS_KEYWORDS = ("distress", "ripped", "destroyed")
+
+def _has_distressing(product_data: Dict) -> bool:
+    """Return True if the product is a pair of jeans with distressing details."""
+    description = product_data.get('Description', '').lower()
+    # Most products are not denim, so bail out before looking for distressing terms
+    if not any(keyword in description for keyword in _JEANS_KEYWORDS):
+        return False
+    return any(keyword in description for keyword in _DISTRESS_KEYWORDS)
+
+@lru_cache(maxsize=64)
+def _render_prompt_template(jeans_with_distressing: bool, model_type: str, aspect_ratio: str, aspect_description: str) -> str:
+    """
+    Fill in the product-level fields of a prompt template.
+    
+    The {background} and {pose} placeholders are left in place so the result
+    can be cached and completed cheaply for each background variation.
+    """
+    template = JEANS_PROMPT_TEMPLATE if jeans_with_distressing else STANDARD_PROMPT_TEMPLATE
+    return template.format(
+        model_type=model_type,
+        model_type_title=model_type.capitalize(),
+        aspect_ratio=aspect_ratio,
+        aspect_description=aspect_description,
+        background="{background}",
+        pose="{pose}",
+    )
+
+@lru_cache(maxsize=1024)
+def _render_prompt(jeans_with_distressing: bool, model_type: str, aspect_ratio: str, aspect_description: str, background: str, pose: str) -> str:
+    """
+    Build the full prompt from already-resolved primitives.
+    
+    Keyed on the chosen pose rather than on product_data, so repeated calls
+    are served from the cache while random pose selection still varies.
+    """
+    template = _render_prompt_template(jeans_with_distressing, model_type, aspect_ratio, aspect_description)
+    return template.replace("{pose}", pose).replace("{background}", background)
+
 class ImageGenerator:
     def __init__(self):
         """Initializes the image generator with both Gemini and Replicate support."""
@@ -247,112 +389,14 @@ class ImageGenerator:
                 pose = "standing straight with confident, natural posture showcasing the outfit"
         
         # Check if this is a jeans product with distressing details
-        product_description = product_data.get('Description', '').lower()
-        is_jeans = 'jeans' in product_description or 'denim' in product_description
-        has_distressing = 'distress' in product_description or 'ripped' in product_description or 'destroyed' in product_description
+        jeans_with_distressing = _has_distressing(product_data)
         
-        # Enhanced prompt with advanced fashion photography techniques and specific pose
-        if is_jeans and has_distressing:
-            # Specialized prompt for jeans with distressing details
-            prompt = f"""
-Professional high-fashion photography of a single {model_type} model wearing the exact pair of jeans shown in the reference images, positioned in a {background}.
-
-PHOTOGRAPHY DIRECTIVES:
-- Show ONLY ONE person in the image with professional studio lighting
-- Generate image with {aspect_description}
-- The background MUST completely fill the frame with no white borders or margins
-
-CRITICALLY IMPORTANT: The generated image MUST show the EXACT SAME pair of jeans as in the reference images. Do NOT modify, change, or alter the jeans in any way.
-
-The model MUST be wearing the identical jeans from the reference images with no changes to:
-  * Color, material, and design
-  * All distressing details (rips, tears, fading, whiskering, etc.)
-  * Specific distressing locations (knee tears, thigh rips, pocket wear, etc.)
-  * Fit and silhouette (skinny, straight, tapered, etc.)
-  * Wash type (dark, medium, light, black, etc.)
-  * Hardware details (buttons, rivets, zippers, etc.)
-  * Stitching patterns and thread color
-  * All visual elements and styling
-
-Use the reference images as the absolute source of truth for the jeans appearance.
-
-POSE AND MODEL SPECIFICATIONS:
-- Position model {pose}
-- {model_type.capitalize()} with professional runway modeling posture
-- Natural, confident facial expression with subtle smile
-- Perfect body proportions and professional posing
-- Skin tone and features appropriate for the {model_type} specification
-- No duplicate or repeated figures in the composition
-
-BACKGROUND AND LIGHTING:
-- Background seamlessly extends to all edges of the image frame
-- Lighting matches the environment (natural for outdoor, studio for indoor)
-- Shadows and reflections consistent with the scene
-- Professional fashion editorial quality throughout
-
-CRITICAL RESTRICTIONS FOR JEANS WITH DISTRESSING:
-- DO NOT reinterpret or redesign the distressing pattern in any way
-- DO NOT change the location, size, or shape of any rips or tears
-- DO NOT add or remove any distressing details
-- DO NOT modify the wash pattern or fading effects
-- The jeans shown MUST be IDENTICAL to the reference images in ALL visual aspects
-- Focus ONLY on the background setting and model pose, not on jeans modification
-
-ASPECT RATIO ENFORCEMENT:
-- CRITICALLY IMPORTANT: Generate the image with EXACTLY {aspect_ratio} aspect ratio
-- DO NOT crop, stretch, or distort the image in any way
-- Ensure the composition fits perfectly within the {aspect_ratio} frame
-- Maintain all visual elements and proportions as specified
-"""
-        else:
-            # Standard prompt for other products
-            prompt = f"""
-Professional high-fashion photography of a single {model_type} model wearing the exact product shown in the reference images, positioned in a {background}.
-
-PHOTOGRAPHY DIRECTIVES:
-- Show ONLY ONE person in the image with professional studio lighting
-- Generate image with {aspect_description}
-- The background MUST completely fill the frame with no white borders or margins
-
-CRITICALLY IMPORTANT: The generated image MUST show the EXACT SAME product as in the reference images. Do NOT modify, change, or alter the product in any way.
-
-The model MUST be wearing the identical product from the reference images with no changes to:
-  * Color, material, and design
-  * All design details (neckline, sleeves, hemline, patterns, textures)
-  * Fit and silhouette
-  * Length and proportions
-  * All visual elements and styling
-
-Use the reference images as the absolute source of truth for the product appearance.
-
-POSE AND MODEL SPECIFICATIONS:
-- Position model {pose}
-- {model_type.capitalize()} with professional runway modeling posture
-- Natural, confident facial expression with subtle smile
-- Perfect body proportions and professional posing
-- Skin tone and features appropriate for the {model_type} specification
-- No duplicate or repeated figures in the composition
-
-BACKGROUND AND LIGHTING:
-- Background seamlessly extends to all edges of the image frame
-- Lighting matches the environment (natural for outdoor, studio for indoor)
-- Shadows and reflections consistent with the scene
-- Professional fashion editorial quality throughout
-
-CRITICAL RESTRICTIONS:
-- DO NOT reinterpret or redesign the product in any way
-- DO NOT change any visual aspects of the product (color, pattern, texture, fit, etc.)
-- DO NOT add or remove any design elements from the product
-- The product shown MUST be IDENTICAL to the reference images in ALL visual aspects
-- Focus ONLY on the background setting and model pose, not on product modification
-
-ASPECT RATIO ENFORCEMENT:
-- CRITICALLY IMPORTANT: Generate the image with EXACTLY {aspect_ratio} aspect ratio
-- DO NOT crop, stretch, or distort the image in any way
-- Ensure the composition fits perfectly within the {aspect_ratio} frame
-- Maintain all visual elements and proportions as specified
-"""
-        logger.info(f"Generated prompt for background '{background}' with aspect ratio '{aspect_ratio}' and gender '{gender}': {prompt}")
+        # Enhanced prompt with advanced fashion photography techniques and specific pose.
+        # Everything except the background and pose is fixed per product, so that
+        # part is rendered once and reused across background variations.
+        prompt = _render_prompt(jeans_with_distressing, model_type, aspect_ratio, aspect_description, background, pose)
+        # Lazy %-formatting: the multi-KB prompt is only interpolated if INFO is emitted
+        logger.info("Generated prompt for background '%s' with aspect ratio '%s' and gender '%s': %s", background, aspect_ratio, gender, prompt)
         return prompt
 
     def _convert_image_to_data_url(self, image_path: str) -> str:
@@ -373,7 +417,7 @@ ASPECT RATIO ENFORCEMENT:
     ) -> Optional[bytes]:
         """Runs image generation using Gemini API with new gemini-2.5-flash-image-preview model."""
         try:
-            logger.info(f"Generating image with Gemini using prompt: {prompt}")
+            logger.info("Generating image with Gemini using prompt: %s", prompt)
             
             # Prepare content for Gemini API
             contents = [prompt]
@@ -446,7 +490,7 @@ ASPECT RATIO ENFORCEMENT:
         }
         
         try:
-            logger.info(f"Generating image with prompt: {prompt}")
+            logger.info("Generating image with prompt: %s", prompt)
             output = await asyncio.to_thread(replicate.run, self.primary_model, input=input_data)
             
             image_url = None
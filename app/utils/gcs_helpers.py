@@ -5,6 +5,7 @@ from fastapi import HTTPException
 from app.core.config import settings
 import logging
 import io
+from typing import Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,25 +22,41 @@ def get_gcs_client():
         logger.error("Failed to initialize GCS client.", exc_info=True)
         raise HTTPException(status_code=500, detail="Server is not configured for GCS uploads.") from e
 
-def upload_file_to_gcs(file_obj: io.BytesIO, object_name: str) -> str:
+def upload_file_to_gcs(
+    file_obj: io.BytesIO,
+    object_name: str,
+    client: Optional[storage.Client] = None,
+    if_generation_match: Optional[int] = None
+) -> str:
     """
     Upload a file-like object to a GCS bucket and return its public URL.
 
     Args:
         file_obj: File-like object to upload.
         object_name: The name of the object in the GCS bucket.
+        client: Optional existing GCS client to reuse. A new one is created if omitted.
+        if_generation_match: Optional generation precondition. Pass 0 to only
+            create the object if it does not exist yet.
 
     Returns:
         The permanent URL of the uploaded file.
     """
-    client = get_gcs_client()
+    if client is None:
+        client = get_gcs_client()
     try:
         bucket = client.bucket(settings.GCS_BUCKET_NAME)
         blob = bucket.blob(object_name)
         
-        # Reset file pointer to beginning
+        # Pass the size explicitly so small files go up in a single request
+        # instead of a resumable upload session
+        size = file_obj.seek(0, io.SEEK_END)
         file_obj.seek(0)
-        blob.upload_from_file(file_obj)
+        blob.upload_from_file(
+            file_obj,
+            size=size,
+            checksum="crc32c",
+            if_generation_match=if_generation_match
+        )
         
         # Make the blob publicly readable
         blob.make_public()
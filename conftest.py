@@ -0,0 +1,10 @@
+"""
+Shared pytest fixtures for the test scripts.
+"""
+import pytest
+
+@pytest.fixture(scope="session")
+def generator():
+    """Share one ImageGenerator across the test session"""
+    from tests._generator import get_generator
+    return get_generator()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Combined test runner that sends every test payload to the API concurrently.
+
+All POSTs share one httpx.AsyncClient with HTTP/2 enabled, so when the server
+speaks h2 the requests are multiplexed over a single connection instead of
+queueing behind each other on separate HTTP/1.1 connections.
+"""
+import asyncio
+import logging
+import time
+
+import httpx
+
+import run_test
+import test_gender_feature
+import test_image_generation_with_upscale
+from tests._util import run_async, setup_logging
+
+log = logging.getLogger(__name__)
+
+# Configuration
+BASE_URL = "http://127.0.0.1:8000"
+ENDPOINT = "/api/v1/generate/image"
+
+# (name, payload, expected status code)
+TEST_PAYLOADS = [
+    ("simple_request", run_test.TEST_DATA, 200),
+    ("male_model", test_gender_feature.MALE_TEST_DATA, 200),
+    ("female_model", test_gender_feature.FEMALE_TEST_DATA, 200),
+    ("invalid_gender", test_gender_feature.INVALID_GENDER_TEST_DATA, 400),
+    ("image_generation_with_upscale", test_image_generation_with_upscale.TEST_DATA, 200),
+]
+
+async def run_one(client: httpx.AsyncClient, name: str, payload: dict, expected_status: int) -> bool:
+    """Send a single test payload and report whether the status code matched."""
+    start_time = time.perf_counter()
+    try:
+        response = await client.post(ENDPOINT, json=payload)
+    except httpx.HTTPError as e:
+        log.error(f"💥 {name}: {type(e).__name__} - {e}")
+        return False
+
+    elapsed = time.perf_counter() - start_time
+    passed = response.status_code == expected_status
+    if passed:
+        log.info(f"✅ {name}: HTTP {response.status_code} ({response.http_version}) in {elapsed:.2f}s")
+    else:
+        log.error(f"❌ {name}: HTTP {response.status_code} ({response.http_version}) in {elapsed:.2f}s")
+    return passed
+
+async def run_all() -> bool:
+    """Send all test payloads concurrently over a shared HTTP/2 client."""
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+    async with httpx.AsyncClient(base_url=BASE_URL, http2=True, limits=limits, timeout=800) as client:
+        tasks = [
+            run_one(client, name, payload, expected_status)
+            for name, payload, expected_status in TEST_PAYLOADS
+        ]
+        results = await asyncio.gather(*tasks)
+    return all(results)
+
+if __name__ == "__main__":
+    setup_logging()
+    log.info("🧪 Running all FashionModelingAI API tests concurrently")
+    log.debug("=" * 60)
+    success = run_async(run_all())
+    if success:
+        log.info("\n✅ ALL TESTS PASSED")
+    else:
+        log.error("\n❌ SOME TESTS FAILED")
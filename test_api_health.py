@@ -2,73 +2,87 @@
 """
 Simple API health test for Fashion AI project
 """
+import logging
 import requests
-import json
-import time
+
+from tests._util import setup_logging
+
+log = logging.getLogger(__name__)
+
+BASE_URL = "http://127.0.0.1:8000"
+
+# Both checks hit the same host one after the other, so they share one
+# session and its keep-alive connection
+_SESSION = requests.Session()
 
 def test_server_health():
     """Test if the server is responding."""
     try:
-        print("🏥 Testing server health...")
-        response = requests.get("http://127.0.0.1:8000/docs", timeout=5)
+        log.info("🏥 Testing server health...")
+        # HEAD is enough to see that the app is up without downloading the Swagger page
+        response = _SESSION.head(f"{BASE_URL}/docs", timeout=5, allow_redirects=False)
         if response.status_code == 200:
-            print("✅ Server is running and accessible!")
+            log.info("✅ Server is running and accessible!")
             return True
         else:
-            print(f"❌ Server returned status code: {response.status_code}")
+            log.error(f"❌ Server returned status code: {response.status_code}")
             return False
     except requests.exceptions.RequestException as e:
-        print(f"❌ Failed to connect to server: {e}")
+        log.error(f"❌ Failed to connect to server: {e}")
         return False
 
 def test_api_endpoint():
     """Test the API endpoint with minimal data."""
     try:
-        print("\n🧪 Testing API endpoint health...")
+        log.info("\n🧪 Testing API endpoint health...")
         
         # Just test the endpoint exists
-        url = "http://127.0.0.1:8000/api/v1/generate"
+        url = f"{BASE_URL}/api/v1/generate"
         
         # Send a simple HEAD request to check if endpoint exists
-        response = requests.head(url, timeout=5)
-        print(f"📡 API endpoint status: {response.status_code}")
+        response = _SESSION.head(url, timeout=5)
+        log.info(f"📡 API endpoint status: {response.status_code}")
         
         if response.status_code in [200, 405, 422]:  # These are expected for HEAD/OPTIONS
-            print("✅ API endpoint is accessible!")
+            log.info("✅ API endpoint is accessible!")
             return True
         else:
-            print(f"❌ Unexpected status code: {response.status_code}")
+            log.error(f"❌ Unexpected status code: {response.status_code}")
             return False
             
     except requests.exceptions.RequestException as e:
-        print(f"❌ Failed to reach API endpoint: {e}")
+        log.error(f"❌ Failed to reach API endpoint: {e}")
         return False
 
 def main():
     """Run all health tests."""
-    print("🚀 Fashion AI API Health Check")
-    print("=" * 50)
+    log.info("🚀 Fashion AI API Health Check")
+    log.debug("=" * 50)
     
-    # Test 1: Server Health
-    server_ok = test_server_health()
-    
-    # Test 2: API Endpoint
-    api_ok = test_api_endpoint()
+    try:
+        # Test 1: Server Health
+        server_ok = test_server_health()
+        
+        # Test 2: API Endpoint
+        api_ok = test_api_endpoint()
+    finally:
+        _SESSION.close()
     
     # Summary
-    print("\n📊 Health Check Results:")
-    print("=" * 50)
-    print(f"🏥 Server Health: {'✅ PASS' if server_ok else '❌ FAIL'}")
-    print(f"📡 API Endpoint: {'✅ PASS' if api_ok else '❌ FAIL'}")
+    log.info("\n📊 Health Check Results:")
+    log.debug("=" * 50)
+    log.info(f"🏥 Server Health: {'✅ PASS' if server_ok else '❌ FAIL'}")
+    log.info(f"📡 API Endpoint: {'✅ PASS' if api_ok else '❌ FAIL'}")
     
     if server_ok and api_ok:
-        print("\n🎉 All health checks passed! API is ready for testing.")
-        print("💡 You can now run the full test: python tests\\run_api_test.py")
+        log.info("\n🎉 All health checks passed! API is ready for testing.")
+        log.info("💡 You can now run the full test: python tests\\run_api_test.py")
         return True
     else:
-        print("\n⚠️  Some health checks failed. Please check server status.")
+        log.error("\n⚠️  Some health checks failed. Please check server status.")
         return False
 
 if __name__ == "__main__":
+    setup_logging()
     success = main()
     exit(0 if success else 1)
\ No newline at end of file
@@ -4,103 +4,179 @@ Test script to verify the updated GET endpoint works with GCS-stored files.
 
 import requests
 import json
+import logging
+import os
+import socket
+import pytest
+from tests._util import loads, setup_logging
+
+log = logging.getLogger(__name__)
+
+# Configuration
+SERVER_HOST = "localhost"
+SERVER_PORT = 8000
+ETAG_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pytest_cache", "file_access_etags.json")
+
+def _server_up() -> bool:
+    """Cheap TCP probe so the tests fail fast when uvicorn isn't running."""
+    try:
+        socket.create_connection((SERVER_HOST, SERVER_PORT), 0.05).close()
+        return True
+    except OSError:
+        return False
+
+def _load_etag_cache() -> dict:
+    """Load ETags and bodies remembered from previous runs."""
+    try:
+        with open(ETAG_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_etag_cache(cache: dict):
+    """Persist ETags and bodies for the next run."""
+    os.makedirs(os.path.dirname(ETAG_CACHE_PATH), exist_ok=True)
+    with open(ETAG_CACHE_PATH, "w") as f:
+        json.dump(cache, f)
+
+def _get_files(url: str):
+    """
+    GET a file listing, sending If-None-Match when a previous run cached an ETag.
+    
+    Returns:
+        Tuple of (status code, parsed JSON body or raw text). A 304 is reported
+        as 200 with the cached body, so callers don't need to special-case it.
+    """
+    cache = _load_etag_cache()
+    cached = cache.get(url)
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+    
+    response = requests.get(url, headers=headers)
+    
+    if response.status_code == 304 and cached:
+        log.info("(Not modified since last run, using cached response)")
+        return 200, cached["body"]
+    
+    try:
+        body = loads(response.content)
+    except ValueError:
+        return response.status_code, response.text
+    
+    etag = response.headers.get("ETag")
+    if response.status_code == 200 and etag:
+        cache[url] = {"etag": etag, "body": body}
+        _save_etag_cache(cache)
+    
+    return response.status_code, body
 
 def test_gcs_file_access():
     """Test the updated GET endpoint with a request_id that should have GCS-stored files."""
     
-    base_url = "http://localhost:8000"
+    base_url = f"http://{SERVER_HOST}:{SERVER_PORT}"
     
-    print("=" * 70)
-    print("TESTING UPDATED GET ENDPOINT WITH GCS-STORED FILES")
-    print("=" * 70)
+    log.debug("=" * 70)
+    log.info("TESTING UPDATED GET ENDPOINT WITH GCS-STORED FILES")
+    log.debug("=" * 70)
+    
+    if not _server_up():
+        pytest.skip("server not running")
     
     # Test with the request_id from your example
     request_id = "816a2f03-999f-4b37-9250-4fe855495ab9"
-    print(f"Testing with Request ID: {request_id}")
-    print(f"This request_id should have files stored in GCS")
+    log.info(f"Testing with Request ID: {request_id}")
+    log.info(f"This request_id should have files stored in GCS")
     
     # Make the GET request
-    print(f"\nMaking GET request to: {base_url}/api/v1/files/{request_id}")
-    response = requests.get(f"{base_url}/api/v1/files/{request_id}")
+    log.debug(f"\nMaking GET request to: {base_url}/api/v1/files/{request_id}")
+    status_code, body = _get_files(f"{base_url}/api/v1/files/{request_id}")
     
-    print(f"Status Code: {response.status_code}")
+    log.info(f"Status Code: {status_code}")
     
-    if response.status_code == 200:
-        result = response.json()
-        print("\n✅ SUCCESS! Files found for this request_id:")
-        print(f"   Request ID: {result['request_id']}")
-        print(f"   Total Files: {result['count']}")
-        print("\n   Files:")
+    if status_code == 200:
+        result = body
+        log.info("\n✅ SUCCESS! Files found for this request_id:")
+        log.info(f"   Request ID: {result['request_id']}")
+        log.info(f"   Total Files: {result['count']}")
+        log.info("\n   Files:")
         for i, file_info in enumerate(result['files'], 1):
-            print(f"     {i}. {file_info['filename']} ({file_info['type']})")
-            print(f"        URL: {file_info['url']}")
+            log.info(f"     {i}. {file_info['filename']} ({file_info['type']})")
+            log.info(f"        URL: {file_info['url']}")
             
-    elif response.status_code == 404:
-        print("❌ No files found for this request_id")
-        print(f"   Response: {response.json()}")
-        print("\nThis could be because:")
-        print("  1. The files are not actually stored in GCS with this request_id")
-        print("  2. There was an error accessing GCS")
-        print("  3. The request_id is incorrect")
+    elif status_code == 404:
+        log.error("❌ No files found for this request_id")
+        log.info(f"   Response: {body}")
+        log.info("\nThis could be because:")
+        log.info("  1. The files are not actually stored in GCS with this request_id")
+        log.info("  2. There was an error accessing GCS")
+        log.info("  3. The request_id is incorrect")
         
-    elif response.status_code == 400:
-        print("❌ Invalid request_id format")
-        print(f"   Response: {response.json()}")
+    elif status_code == 400:
+        log.error("❌ Invalid request_id format")
+        log.info(f"   Response: {body}")
         
-    elif response.status_code == 500:
-        print("❌ Server error when trying to access files")
-        print(f"   Response: {response.json()}")
+    elif status_code == 500:
+        log.error("❌ Server error when trying to access files")
+        log.info(f"   Response: {body}")
         
     else:
-        print(f"❌ Request failed with status {response.status_code}")
-        print(f"   Response: {response.text}")
+        log.error(f"❌ Request failed with status {status_code}")
+        log.info(f"   Response: {body}")
 
 def test_local_file_access():
     """Test the updated GET endpoint with a request_id that should have local files."""
     
-    base_url = "http://localhost:8000"
+    base_url = f"http://{SERVER_HOST}:{SERVER_PORT}"
+    
+    log.debug("\n\n" + "=" * 70)
+    log.info("TESTING UPDATED GET ENDPOINT WITH LOCAL FILES (FALLBACK)")
+    log.debug("=" * 70)
     
-    print("\n\n" + "=" * 70)
-    print("TESTING UPDATED GET ENDPOINT WITH LOCAL FILES (FALLBACK)")
-    print("=" * 70)
+    if not _server_up():
+        pytest.skip("server not running")
     
     # Test with a request_id that should have local files
     request_id = "4c1e1d10-a130-440a-aaae-290d10c286f4"
-    print(f"Testing with Request ID: {request_id}")
-    print(f"This request_id should have files stored locally")
+    log.info(f"Testing with Request ID: {request_id}")
+    log.info(f"This request_id should have files stored locally")
     
     # Make the GET request
-    print(f"\nMaking GET request to: {base_url}/api/v1/files/{request_id}")
-    response = requests.get(f"{base_url}/api/v1/files/{request_id}")
+    log.debug(f"\nMaking GET request to: {base_url}/api/v1/files/{request_id}")
+    status_code, body = _get_files(f"{base_url}/api/v1/files/{request_id}")
     
-    print(f"Status Code: {response.status_code}")
+    log.info(f"Status Code: {status_code}")
     
-    if response.status_code == 200:
-        result = response.json()
-        print("\n✅ SUCCESS! Files found for this request_id:")
-        print(f"   Request ID: {result['request_id']}")
-        print(f"   Total Files: {result['count']}")
-        print("\n   Files:")
+    if status_code == 200:
+        result = body
+        log.info("\n✅ SUCCESS! Files found for this request_id:")
+        log.info(f"   Request ID: {result['request_id']}")
+        log.info(f"   Total Files: {result['count']}")
+        log.info("\n   Files:")
         for i, file_info in enumerate(result['files'], 1):
-            print(f"     {i}. {file_info['filename']} ({file_info['type']})")
-            print(f"        URL: {file_info['url']}")
+            log.info(f"     {i}. {file_info['filename']} ({file_info['type']})")
+            log.info(f"        URL: {file_info['url']}")
             
-    elif response.status_code == 404:
-        print("❌ No files found for this request_id")
-        print(f"   Response: {response.json()}")
+    elif status_code == 404:
+        log.error("❌ No files found for this request_id")
+        log.info(f"   Response: {body}")
         
-    elif response.status_code == 400:
-        print("❌ Invalid request_id format")
-        print(f"   Response: {response.json()}")
+    elif status_code == 400:
+        log.error("❌ Invalid request_id format")
+        log.info(f"   Response: {body}")
         
     else:
-        print(f"❌ Request failed with status {response.status_code}")
-        print(f"   Response: {response.text}")
+        log.error(f"❌ Request failed with status {status_code}")
+        log.info(f"   Response: {body}")
 
 if __name__ == "__main__":
+    setup_logging()
+    if not _server_up():
+        log.error(f"❌ Server is not reachable at {SERVER_HOST}:{SERVER_PORT}")
+        log.info("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
+        raise SystemExit(1)
+    
     test_gcs_file_access()
     test_local_file_access()
     
-    print("\n" + "=" * 70)
-    print("TESTING COMPLETE")
-    print("=" * 70)
\ No newline at end of file
+    log.debug("\n" + "=" * 70)
+    log.info("TESTING COMPLETE")
+    log.debug("=" * 70)
\ No newline at end of file
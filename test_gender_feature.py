@@ -2,290 +2,217 @@
 """
 Test script for the gender-based clothing feature
 """
-import requests
-import json
+import asyncio
+import logging
+import aiohttp
+import pytest
+import pytest_asyncio
+from tests._util import pp, loads, run_async, setup_logging
+from tests._report import handle_response
+
+log = logging.getLogger(__name__)
 
 # Configuration
 BASE_URL = "http://127.0.0.1:8000"
 ENDPOINT = "/api/v1/generate/image"
 
-def test_male_model():
+# Test data with male gender
+MALE_TEST_DATA = {
+    "inputImages": [
+        {
+            "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/WhatsApp%20Image%202025-09-19%20at%2012.36.01_0cca7d65.jpg?alt=media&token=704093fa-6d46-4006-a459-ed995cb423a2",
+            "view": "front",
+            "backgrounds": [1, 1, 1]  # 1 white, 1 plain, 1 random
+        }
+    ],
+    "productType": "shirt",
+    "gender": "male",  # Specify male gender
+    "text": "Casual shirt for men",
+    "isVideo": False,
+    "upscale": True,
+    "numberOfOutputs": 1,
+    "generateCsv": True
+}
+
+# Test data with female gender
+FEMALE_TEST_DATA = {
+    "inputImages": [
+        {
+            "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/WhatsApp%20Image%202025-09-19%20at%2012.36.01_0cca7d65.jpg?alt=media&token=704093fa-6d46-4006-a459-ed995cb423a2",
+            "view": "front",
+            "backgrounds": [1, 1, 1]  # 1 white, 1 plain, 1 random
+        }
+    ],
+    "productType": "dress",
+    "gender": "female",  # Specify female gender
+    "text": "Elegant dress for women",
+    "isVideo": False,
+    "upscale": True,
+    "numberOfOutputs": 1,
+    "generateCsv": True
+}
+
+# Test data with invalid gender
+INVALID_GENDER_TEST_DATA = {
+    "inputImages": [
+        {
+            "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/WhatsApp%20Image%202025-09-19%20at%2012.36.01_0cca7d65.jpg?alt=media&token=704093fa-6d46-4006-a459-ed995cb423a2",
+            "view": "front",
+            "backgrounds": [1, 0, 0]  # 1 white, 0 plain, 0 random
+        }
+    ],
+    "productType": "general",
+    "gender": "other",  # Invalid gender
+    "text": "Test product",
+    "isVideo": False,
+    "upscale": True,
+    "numberOfOutputs": 1,
+    "generateCsv": True
+}
+
+def _create_session() -> aiohttp.ClientSession:
+    """Create the shared client session used by all three tests."""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=180),  # 3 minutes timeout
+        connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60)
+    )
+
+@pytest_asyncio.fixture
+async def session():
+    """Shared client session for pytest runs"""
+    async with _create_session() as client_session:
+        yield client_session
+
+async def _post(session: aiohttp.ClientSession, test_data: dict):
+    """POST a payload and return (status code, parsed JSON body or None, raw text)."""
+    async with session.post(f"{BASE_URL}{ENDPOINT}", json=test_data) as response:
+        response_body = await response.read()
+    try:
+        response_data = loads(response_body)
+    except ValueError:
+        response_data = None
+    return response.status, response_data, response_body.decode(errors="replace")
+
+@pytest.mark.asyncio
+async def test_male_model(session: aiohttp.ClientSession):
     """Test the gender feature with male model"""
     
-    # Test data with male gender
-    test_data = {
-        "inputImages": [
-            {
-                "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/WhatsApp%20Image%202025-09-19%20at%2012.36.01_0cca7d65.jpg?alt=media&token=704093fa-6d46-4006-a459-ed995cb423a2",
-                "view": "front",
-                "backgrounds": [1, 1, 1]  # 1 white, 1 plain, 1 random
-            }
-        ],
-        "productType": "shirt",
-        "gender": "male",  # Specify male gender
-        "text": "Casual shirt for men",
-        "isVideo": False,
-        "upscale": True,
-        "numberOfOutputs": 1,
-        "generateCsv": True
-    }
-    
     try:
-        print("🚀 Sending Request to API with Male Gender")
-        print("=" * 60)
-        print("📝 REQUEST DETAILS:")
-        print(f"   URL: {BASE_URL}{ENDPOINT}")
-        print(f"   Method: POST")
-        print("   JSON Data:")
-        print(json.dumps(test_data, indent=2))
+        # Send the POST request; output is printed afterwards so concurrent
+        # tests don't interleave their reports
+        status_code, response_data, response_text = await _post(session, MALE_TEST_DATA)
         
-        # Send the POST request
-        response = requests.post(
-            f"{BASE_URL}{ENDPOINT}",
-            json=test_data,
-            timeout=180  # 3 minutes timeout
-        )
+        log.info("🚀 Sent Request to API with Male Gender")
+        log.debug("=" * 60)
+        log.debug("📝 REQUEST DETAILS:")
+        log.debug(f"   URL: {BASE_URL}{ENDPOINT}")
+        log.debug(f"   Method: POST")
+        log.debug("   JSON Data:")
+        pp(MALE_TEST_DATA)
         
-        # Process response
-        print(f"\n📡 RESPONSE:")
-        print(f"   Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            print("✅ API Test SUCCESS!")
-            response_data = response.json()
-            
-            print("\n📋 RESPONSE BODY (JSON):")
-            print(json.dumps(response_data, indent=2))
-            
-            # Print key results
-            print(f"\n📄 Summary:")
-            print(f"   Request ID: {response_data.get('request_id', 'N/A')}")
-            
-            if 'output_image_url' in response_data and response_data['output_image_url']:
-                print(f"   ✅ Primary Image: {response_data['output_image_url']}")
-            else:
-                print(f"   ⚠️ No primary image generated")
-                
-            # Show all image variations
-            if 'image_variations' in response_data and response_data['image_variations']:
-                print(f"   🖼️ Image Variations ({len(response_data['image_variations'])} found):")
-                for i, variation in enumerate(response_data['image_variations'], 1):
-                    print(f"     {i}. {variation}")
-            else:
-                print(f"   ℹ️ No image variations generated")
-                
-            if 'excel_report_url' in response_data and response_data['excel_report_url']:
-                print(f"   📊 Excel Report: {response_data['excel_report_url']}")
-            else:
-                print(f"   ⚠️ No Excel report generated")
-                
-            if response_data.get('output_video_url'):
-                print(f"   🎥 Video Generated: {response_data['output_video_url']}")
-            else:
-                print(f"   ℹ️ No video requested")
-            
-            print(f"\n🎉 Test completed successfully!")
-            return True
-            
-        else:
-            print("❌ API Test FAILED")
-            try:
-                error_data = response.json()
-                print("\n📋 ERROR RESPONSE (JSON):")
-                print(json.dumps(error_data, indent=2))
-            except:
-                print(f"\n📋 RAW ERROR:")
-                print(response.text)
-            return False
+        return handle_response(status_code, response_data, response_text)
 
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to server.")
-        print("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
+    except aiohttp.ClientConnectionError:
+        log.error("❌ Could not connect to server.")
+        log.info("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error(f"❌ Unexpected error: {e}")
         return False
 
-def test_female_model():
+@pytest.mark.asyncio
+async def test_female_model(session: aiohttp.ClientSession):
     """Test the gender feature with female model"""
     
-    # Test data with female gender
-    test_data = {
-        "inputImages": [
-            {
-                "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/WhatsApp%20Image%202025-09-19%20at%2012.36.01_0cca7d65.jpg?alt=media&token=704093fa-6d46-4006-a459-ed995cb423a2",
-                "view": "front",
-                "backgrounds": [1, 1, 1]  # 1 white, 1 plain, 1 random
-            }
-        ],
-        "productType": "dress",
-        "gender": "female",  # Specify female gender
-        "text": "Elegant dress for women",
-        "isVideo": False,
-        "upscale": True,
-        "numberOfOutputs": 1,
-        "generateCsv": True
-    }
-    
     try:
-        print("🚀 Sending Request to API with Female Gender")
-        print("=" * 60)
-        print("📝 REQUEST DETAILS:")
-        print(f"   URL: {BASE_URL}{ENDPOINT}")
-        print(f"   Method: POST")
-        print("   JSON Data:")
-        print(json.dumps(test_data, indent=2))
+        # Send the POST request; output is printed afterwards so concurrent
+        # tests don't interleave their reports
+        status_code, response_data, response_text = await _post(session, FEMALE_TEST_DATA)
         
-        # Send the POST request
-        response = requests.post(
-            f"{BASE_URL}{ENDPOINT}",
-            json=test_data,
-            timeout=180  # 3 minutes timeout
-        )
+        log.info("🚀 Sent Request to API with Female Gender")
+        log.debug("=" * 60)
+        log.debug("📝 REQUEST DETAILS:")
+        log.debug(f"   URL: {BASE_URL}{ENDPOINT}")
+        log.debug(f"   Method: POST")
+        log.debug("   JSON Data:")
+        pp(FEMALE_TEST_DATA)
         
-        # Process response
-        print(f"\n📡 RESPONSE:")
-        print(f"   Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            print("✅ API Test SUCCESS!")
-            response_data = response.json()
-            
-            print("\n📋 RESPONSE BODY (JSON):")
-            print(json.dumps(response_data, indent=2))
-            
-            # Print key results
-            print(f"\n📄 Summary:")
-            print(f"   Request ID: {response_data.get('request_id', 'N/A')}")
-            
-            if 'output_image_url' in response_data and response_data['output_image_url']:
-                print(f"   ✅ Primary Image: {response_data['output_image_url']}")
-            else:
-                print(f"   ⚠️ No primary image generated")
-                
-            # Show all image variations
-            if 'image_variations' in response_data and response_data['image_variations']:
-                print(f"   🖼️ Image Variations ({len(response_data['image_variations'])} found):")
-                for i, variation in enumerate(response_data['image_variations'], 1):
-                    print(f"     {i}. {variation}")
-            else:
-                print(f"   ℹ️ No image variations generated")
-                
-            if 'excel_report_url' in response_data and response_data['excel_report_url']:
-                print(f"   📊 Excel Report: {response_data['excel_report_url']}")
-            else:
-                print(f"   ⚠️ No Excel report generated")
-                
-            if response_data.get('output_video_url'):
-                print(f"   🎥 Video Generated: {response_data['output_video_url']}")
-            else:
-                print(f"   ℹ️ No video requested")
-            
-            print(f"\n🎉 Test completed successfully!")
-            return True
-            
-        else:
-            print("❌ API Test FAILED")
-            try:
-                error_data = response.json()
-                print("\n📋 ERROR RESPONSE (JSON):")
-                print(json.dumps(error_data, indent=2))
-            except:
-                print(f"\n📋 RAW ERROR:")
-                print(response.text)
-            return False
+        return handle_response(status_code, response_data, response_text)
 
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to server.")
-        print("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
+    except aiohttp.ClientConnectionError:
+        log.error("❌ Could not connect to server.")
+        log.info("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error(f"❌ Unexpected error: {e}")
         return False
 
-def test_invalid_gender():
+@pytest.mark.asyncio
+async def test_invalid_gender(session: aiohttp.ClientSession):
     """Test the gender feature with invalid gender"""
     
-    # Test data with invalid gender
-    test_data = {
-        "inputImages": [
-            {
-                "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/WhatsApp%20Image%202025-09-19%20at%2012.36.01_0cca7d65.jpg?alt=media&token=704093fa-6d46-4006-a459-ed995cb423a2",
-                "view": "front",
-                "backgrounds": [1, 0, 0]  # 1 white, 0 plain, 0 random
-            }
-        ],
-        "productType": "general",
-        "gender": "other",  # Invalid gender
-        "text": "Test product",
-        "isVideo": False,
-        "upscale": True,
-        "numberOfOutputs": 1,
-        "generateCsv": True
-    }
-    
     try:
-        print("🚀 Sending Request to API with Invalid Gender")
-        print("=" * 60)
-        print("📝 REQUEST DETAILS:")
-        print(f"   URL: {BASE_URL}{ENDPOINT}")
-        print(f"   Method: POST")
-        print("   JSON Data:")
-        print(json.dumps(test_data, indent=2))
+        # Send the POST request; output is printed afterwards so concurrent
+        # tests don't interleave their reports
+        status_code, response_data, response_text = await _post(session, INVALID_GENDER_TEST_DATA)
         
-        # Send the POST request
-        response = requests.post(
-            f"{BASE_URL}{ENDPOINT}",
-            json=test_data,
-            timeout=180  # 3 minutes timeout
-        )
+        log.info("🚀 Sent Request to API with Invalid Gender")
+        log.debug("=" * 60)
+        log.debug("📝 REQUEST DETAILS:")
+        log.debug(f"   URL: {BASE_URL}{ENDPOINT}")
+        log.debug(f"   Method: POST")
+        log.debug("   JSON Data:")
+        pp(INVALID_GENDER_TEST_DATA)
         
         # Process response
-        print(f"\n📡 RESPONSE:")
-        print(f"   Status Code: {response.status_code}")
+        log.info(f"\n📡 RESPONSE:")
+        log.info(f"   Status Code: {status_code}")
         
-        if response.status_code == 400:
-            print("✅ Invalid gender correctly rejected!")
-            try:
-                error_data = response.json()
-                print("\n📋 ERROR RESPONSE (JSON):")
-                print(json.dumps(error_data, indent=2))
-            except:
-                print(f"\n📋 RAW ERROR:")
-                print(response.text)
+        if status_code == 400:
+            log.info("✅ Invalid gender correctly rejected!")
+            if response_data is not None:
+                log.debug("\n📋 ERROR RESPONSE (JSON):")
+                pp(response_data)
+            else:
+                log.debug(f"\n📋 RAW ERROR:")
+                log.debug(response_text)
             return True
         else:
-            print("❌ Invalid gender was not rejected")
-            print("📋 RESPONSE:")
-            try:
-                response_data = response.json()
-                print(json.dumps(response_data, indent=2))
-            except:
-                print(response.text)
+            log.error("❌ Invalid gender was not rejected")
+            log.error("📋 RESPONSE:")
+            if response_data is not None:
+                pp(response_data, logging.ERROR)
+            else:
+                log.error(response_text)
             return False
 
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to server.")
-        print("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
+    except aiohttp.ClientConnectionError:
+        log.error("❌ Could not connect to server.")
+        log.info("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error(f"❌ Unexpected error: {e}")
         return False
 
+async def run_all_tests():
+    """Run the three gender tests concurrently over one client session."""
+    async with _create_session() as client_session:
+        return await asyncio.gather(
+            test_male_model(client_session),
+            test_female_model(client_session),
+            test_invalid_gender(client_session)
+        )
+
 if __name__ == "__main__":
-    print("🧪 Testing FashionModelingAI Gender-Based Clothing Feature")
-    print("=" * 60)
-    
-    # Test with male model
-    print("\n Test 1: Male Model")
-    success1 = test_male_model()
-    
-    # Test with female model
-    print("\n Test 2: Female Model")
-    success2 = test_female_model()
+    setup_logging()
+    log.info("🧪 Testing FashionModelingAI Gender-Based Clothing Feature")
+    log.debug("=" * 60)
     
-    # Test with invalid gender
-    print("\n Test 3: Invalid Gender")
-    success3 = test_invalid_gender()
+    # Male model, female model and invalid gender run concurrently
+    log.info("\n Running Tests: Male Model, Female Model, Invalid Gender")
+    success1, success2, success3 = run_async(run_all_tests())
     
-    print(f"\n{'✅ ALL TESTS PASSED' if all([success1, success2, success3]) else '❌ SOME TESTS FAILED'}")
\ No newline at end of file
+    if all([success1, success2, success3]):
+        log.info("\n✅ ALL TESTS PASSED")
+    else:
+        log.error("\n❌ SOME TESTS FAILED")
\ No newline at end of file
@@ -2,126 +2,79 @@
 """
 Test script for image generation with upscaling
 """
-import requests
-import json
+import logging
+import httpx
+import pytest
+from tests._util import pp, loads, run_async, setup_logging
+from tests._report import handle_response
+
+log = logging.getLogger(__name__)
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 ENDPOINT = "/api/v1/generate/image"
 
-def test_image_generation_with_upscale():
+# Test data with background arrays for single view
+TEST_DATA = {
+    "inputImages": [
+        {
+            "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/11.jpg?alt=media&token=731e6858-99d9-41d3-8d99-ca3b803c4fbf",
+            "view": "front",
+            "backgrounds": [0, 1, 0]  # 1 random background
+        }
+    ],
+    "productType": "general",
+    "gender": "female",
+    "text": "",
+    "isVideo": False,
+    "aspect_ratio":"9:16",
+    "upscale": False,  # Enable upscaling
+    "numberOfOutputs": 1,
+    "generateCsv": True,
+}
+
+@pytest.mark.asyncio
+async def test_image_generation_with_upscale():
     """Test image generation with upscaling enabled"""
     
-    # Test data with background arrays for single view
-    test_data = {
-        "inputImages": [
-            {
-                "url": "https://firebasestorage.googleapis.com/v0/b/irongetnow-57465.appspot.com/o/11.jpg?alt=media&token=731e6858-99d9-41d3-8d99-ca3b803c4fbf",
-                "view": "front",
-                "backgrounds": [0, 1, 0]  # 1 random background
-            }
-        ],
-        "productType": "general",
-        "gender": "female",
-        "text": "",
-        "isVideo": False,
-        "aspect_ratio":"9:16",
-        "upscale": False,  # Enable upscaling
-        "numberOfOutputs": 1,
-        "generateCsv": True,
-    }
-    
     try:
-        print("🚀 Sending Request to API for Image Generation with Upscaling")
-        print("=" * 60)
-        print("📝 REQUEST DETAILS:")
-        print(f"   URL: {BASE_URL}{ENDPOINT}")
-        print(f"   Method: POST")
-        print("   JSON Data:")
-        print(json.dumps(test_data, indent=2))
+        log.info("🚀 Sending Request to API for Image Generation with Upscaling")
+        log.debug("=" * 60)
+        log.debug("📝 REQUEST DETAILS:")
+        log.debug(f"   URL: {BASE_URL}{ENDPOINT}")
+        log.debug(f"   Method: POST")
+        log.debug("   JSON Data:")
+        pp(TEST_DATA)
         
-        # Send the POST request
-        response = requests.post(
-            f"{BASE_URL}{ENDPOINT}",
-            json=test_data,
-            timeout=800  # 3 minutes timeout
-        )
+        # Send the POST request; the read timeout covers the full generation time
+        timeout = httpx.Timeout(800.0, connect=5.0)
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            response = await client.post(f"{BASE_URL}{ENDPOINT}", json=TEST_DATA)
         
-        # Process response
-        print(f"\n📡 RESPONSE:")
-        print(f"   Status Code: {response.status_code}")
+        try:
+            response_data = loads(response.content)
+        except ValueError:
+            response_data = None
         
-        if response.status_code == 200:
-            print("✅ API Test SUCCESS!")
-            response_data = response.json()
-            
-            print("\n📋 RESPONSE BODY (JSON):")
-            print(json.dumps(response_data, indent=2))
-            
-            # Print key results
-            print(f"\n📄 Summary:")
-            print(f"   Request ID: {response_data.get('request_id', 'N/A')}")
-            
-            # Show all image variations
-            if 'image_variations' in response_data and response_data['image_variations']:
-                print(f"   🖼️ Image Variations ({len(response_data['image_variations'])} found):")
-                for i, variation in enumerate(response_data['image_variations'], 1):
-                    print(f"     {i}. {variation}")
-            else:
-                print(f"   ℹ️ No image variations generated")
-                
-            # Show all upscaled images
-            if 'upscale_image' in response_data and response_data['upscale_image']:
-                print(f"   🔍 Upscaled Images ({len(response_data['upscale_image'])} found):")
-                for i, upscaled in enumerate(response_data['upscale_image'], 1):
-                    print(f"     {i}. {upscaled}")
-            else:
-                print(f"   ℹ️ No upscaled images generated")
-                
-            # Check if images were upscaled
-            metadata = response_data.get('metadata', {})
-            if metadata.get('upscaled'):
-                print(f"   📈 Images were upscaled: ✅")
-            else:
-                print(f"   📈 Images were upscaled: ❌")
-                
-            if 'excel_report_url' in response_data and response_data['excel_report_url']:
-                print(f"   📊 Excel Report: {response_data['excel_report_url']}")
-            else:
-                print(f"   ⚠️ No Excel report generated")
-                
-            if response_data.get('output_video_url'):
-                print(f"   🎥 Video Generated: {response_data['output_video_url']}")
-            else:
-                print(f"   ℹ️ No video requested")
-            
-            print(f"\n🎉 Test completed successfully!")
-            return True
-            
-        else:
-            print("❌ API Test FAILED")
-            try:
-                error_data = response.json()
-                print("\n📋 ERROR RESPONSE (JSON):")
-                print(json.dumps(error_data, indent=2))
-            except:
-                print(f"\n📋 RAW ERROR:")
-                print(response.text)
-            return False
+        return handle_response(response.status_code, response_data, response.text)
 
-    except requests.exceptions.ConnectionError:
-        print("❌ Could not connect to server.")
-        print("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
+    except httpx.ConnectError:
+        log.error("❌ Could not connect to server.")
+        log.info("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error(f"❌ Unexpected error: {e}")
         return False
 
 if __name__ == "__main__":
-    print("🧪 Testing FashionModelingAI Image Generation with Upscaling")
-    print("=" * 60)
+    setup_logging()
+    log.info("🧪 Testing FashionModelingAI Image Generation with Upscaling")
+    log.debug("=" * 60)
     
     # Test with single view image
-    success = test_image_generation_with_upscale()
+    success = run_async(test_image_generation_with_upscale())
     
-    print(f"\n{'✅ TEST PASSED' if success else '❌ TEST FAILED'}")
\ No newline at end of file
+    if success:
+        log.info("\n✅ TEST PASSED")
+    else:
+        log.error("\n❌ TEST FAILED")
\ No newline at end of file
@@ -18,19 +18,14 @@ def test_image_upscaler():
     """Test the image upscaler service"""
     try:
         from app.services.image_upscaler import ImageUpscaler
-        import cv2
-        import numpy as np
+        from tests._images import random_jpeg_fixture
         
         # Create upscaler instance
         upscaler = ImageUpscaler()
         logger.info("ImageUpscaler initialized successfully")
         
-        # Create a simple test image (100x100 RGB image)
-        test_img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
-        
-        # Encode as JPEG bytes
-        _, img_bytes = cv2.imencode('.jpg', test_img)
-        img_bytes = img_bytes.tobytes()
+        # Load a cached 100x100 random test image as JPEG bytes
+        img_bytes = random_jpeg_fixture(100)
         
         logger.info(f"Test image created: {len(img_bytes)} bytes")
         
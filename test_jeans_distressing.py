@@ -10,9 +10,25 @@ import os
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.services.image_generator import ImageGenerator
+from tests._generator import get_generator
+from tests._phrases import PhraseMatcher
 
-def test_jeans_distressing_prompt():
+# Jeans-specific phrases expected in the prompt for distressed jeans
+JEANS_CHECKS = [
+    "distressing details",
+    "rips, tears, fading",
+    "knee tears, thigh rips",
+    "wash pattern",
+    "DO NOT change the location, size, or shape of any rips or tears"
+]
+
+# Jeans-specific phrases that must not leak into prompts for other products
+JEANS_ONLY_CHECKS = JEANS_CHECKS[:4]
+
+# Built once; each prompt is then scanned once for all phrases
+JEANS_MATCHER = PhraseMatcher(JEANS_CHECKS)
+
+def test_jeans_distressing_prompt(generator):
     """Test that image prompts for jeans with distressing are properly generated"""
     print("Testing jeans distressing prompt generation...")
     
@@ -52,9 +68,6 @@ def test_jeans_distressing_prompt():
         }
     }
     
-    # Initialize the image generator
-    generator = ImageGenerator()
-    
     # Test backgrounds
     backgrounds = [
         "urban street with brick wall backdrop",
@@ -76,17 +89,11 @@ def test_jeans_distressing_prompt():
         )
         
         # Check for jeans-specific keywords
-        jeans_checks = [
-            "distressing details",
-            "rips, tears, fading",
-            "knee tears, thigh rips",
-            "wash pattern",
-            "DO NOT change the location, size, or shape of any rips or tears"
-        ]
+        found = JEANS_MATCHER.find(prompt)
         
         print("   Jeans-specific checks:")
-        for check in jeans_checks:
-            if check in prompt:
+        for check in JEANS_CHECKS:
+            if check in found:
                 print(f"   ✓ Found: '{check}'")
             else:
                 print(f"   ✗ Missing: '{check}'")
@@ -112,16 +119,11 @@ def test_jeans_distressing_prompt():
         )
         
         # Check that jeans-specific keywords are NOT present
-        jeans_checks = [
-            "distressing details",
-            "rips, tears, fading",
-            "knee tears, thigh rips",
-            "wash pattern"
-        ]
+        found = JEANS_MATCHER.find(prompt)
         
         print("   Ensuring jeans-specific content is NOT present:")
-        for check in jeans_checks:
-            if check in prompt:
+        for check in JEANS_ONLY_CHECKS:
+            if check in found:
                 print(f"   ✗ Unexpectedly found: '{check}'")
             else:
                 print(f"   ✓ Correctly absent: '{check}'")
@@ -134,4 +136,4 @@ def test_jeans_distressing_prompt():
                 print(f"     {line}")
 
 if __name__ == "__main__":
-    test_jeans_distressing_prompt()
\ No newline at end of file
+    test_jeans_distressing_prompt(get_generator())
\ No newline at end of file
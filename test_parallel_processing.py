@@ -3,18 +3,47 @@
 Comprehensive Test Script for Parallel Processing
 Tests the Fashion AI system with multiple concurrent requests
 """
-import requests
 import asyncio
 import aiohttp
-import json
+import logging
+import os
+import queue
+import random
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional
+
+from tests._util import dumps, loads, run_async, setup_logging
+
+log = logging.getLogger(__name__)
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 IMAGE_ENDPOINT = "/api/v1/generate/image"
 STATUS_ENDPOINT = "/api/v1/status/queue"
+# Fixed headers set once on the session; aiohttp's auto headers are skipped
+SESSION_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+SKIP_AUTO_HEADERS = ("User-Agent", "Accept-Encoding")
+# Client-side requests-per-minute cap for all generation requests (0 = unlimited)
+MAX_RPM = int(os.getenv("MAX_RPM", "60"))
+# Statuses the server uses for queue pressure; these are retried with backoff
+RETRY_STATUSES = (429, 503)
+MAX_ATTEMPTS = 5
+
+# Pooled keep-alive client for the synchronous comparison test, created on first use
+_SYNC_CLIENT = None
+
+def _get_sync_client():
+    """Return the shared httpx client, importing httpx only when the sync test runs"""
+    global _SYNC_CLIENT
+    if _SYNC_CLIENT is None:
+        import httpx
+        _SYNC_CLIENT = httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True
+        )
+    return _SYNC_CLIENT
 
 # Test data
 TEST_DATA = {
@@ -34,6 +63,136 @@ TEST_DATA = {
     "generateCsv": True,
 }
 
+def _encode_rest(test_data: Dict) -> bytes:
+    """Serialize every field except "text", without the opening brace"""
+    return dumps({k: v for k, v in test_data.items() if k != "text"})[1:]
+
+# The shared part of TEST_DATA, serialized once for every request
+_TEST_DATA_REST = _encode_rest(TEST_DATA)
+
+def _start_log_listener() -> QueueListener:
+    """
+    Route this module's log records through a queue.
+    
+    A background thread drains the queue into the root handlers, so per-request
+    logging never blocks the event loop on a stdout/stderr write.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    log.addHandler(QueueHandler(log_queue))
+    log.propagate = False
+    listener.start()
+    return listener
+
+def _stop_log_listener(listener: QueueListener):
+    """Flush queued records and restore direct logging"""
+    listener.stop()
+    for handler in [h for h in log.handlers if isinstance(h, QueueHandler)]:
+        log.removeHandler(handler)
+    log.propagate = True
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait before a retry: Retry-After if given, else exponential backoff with jitter"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(2 ** attempt, 30) + random.random()
+
+class SlidingWindowLimiter:
+    """
+    Client-side rate limit: at most `rpm` requests in any `window` seconds.
+    
+    Keeps the tester under the server's capacity up front instead of
+    discovering it through 429s, which would pollute the latency numbers.
+    """
+    
+    def __init__(self, rpm: int = 60, window: float = 60.0):
+        self.rpm = rpm
+        self.window = window
+        self._sent_at = deque()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def wait_if_throttled(self):
+        """Wait until a request may be sent, then record it"""
+        if not self.rpm:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                while self._sent_at and now - self._sent_at[0] >= self.window:
+                    self._sent_at.popleft()
+                if len(self._sent_at) < self.rpm:
+                    break
+                await asyncio.sleep(self._sent_at[0] + self.window - now)
+            self._sent_at.append(time.monotonic())
+    
+    def pause(self, seconds: float):
+        """Hold off every new request, e.g. after the server sends Retry-After"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+class AIMDController:
+    """
+    Adaptive concurrency limit using additive-increase/multiplicative-decrease.
+    
+    Like TCP congestion control: the limit grows by alpha after each healthy
+    response and is multiplied by beta when the server pushes back (429/502/503),
+    the request fails at the transport level (no status code), or the average
+    latency over the recent window exceeds the target.
+    """
+    
+    BACKPRESSURE_STATUSES = (429, 502, 503)
+    
+    def __init__(self, c_min: int = 1, c_max: int = 50, c_init: Optional[int] = None,
+                 alpha: float = 0.5, beta: float = 0.5, latency_target: float = 30.0,
+                 window: int = 20):
+        self.c_min = c_min
+        self.c_max = c_max
+        self.limit = float(c_init if c_init is not None else c_min)
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._latencies = deque(maxlen=window)
+        self._condition = asyncio.Condition()
+    
+    async def acquire(self):
+        """Wait until a slot is free under the current limit"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+    
+    async def release(self, latency: float, status_code: Optional[int]):
+        """Free a slot and adjust the limit from the observed response"""
+        if status_code is None:
+            # The connection was refused or reset; back off, but keep the
+            # failure's near-zero time out of the latency window
+            overloaded = True
+        else:
+            self._latencies.append(latency)
+            average_latency = sum(self._latencies) / len(self._latencies)
+            overloaded = status_code in self.BACKPRESSURE_STATUSES or average_latency > self.latency_target
+        
+        if overloaded:
+            self.limit = max(self.c_min, self.limit * self.beta)
+        else:
+            self.limit = min(self.c_max, self.limit + self.alpha)
+        
+        await self.abandon()
+    
+    async def abandon(self):
+        """Free a slot without recording an outcome, e.g. when a request is cancelled"""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
 class ParallelProcessingTester:
     """Test suite for parallel processing capabilities"""
     
@@ -41,12 +200,29 @@ class ParallelProcessingTester:
         self.base_url = base_url
         self.session = None
         self.results = []
+        # Adaptive concurrency limit, only set while a stress test is running
+        self.controller: Optional[AIMDController] = None
+        self.limiter: Optional[SlidingWindowLimiter] = None
         
     async def __aenter__(self):
         """Async context manager entry"""
-        connector = aiohttp.TCPConnector(limit=50, limit_per_host=20)
+        # Keep connections alive between bursts and cache DNS so follow-up
+        # requests skip the handshake; aiohttp already sets TCP_NODELAY
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            limit_per_host=20,
+            keepalive_timeout=75,
+            ttl_dns_cache=300
+        )
         timeout = aiohttp.ClientTimeout(total=600)  # 10 minute timeout
-        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=SESSION_HEADERS,
+            skip_auto_headers=SKIP_AUTO_HEADERS,
+            json_serialize=lambda obj: dumps(obj).decode()
+        )
+        self.limiter = SlidingWindowLimiter(rpm=MAX_RPM)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -59,108 +235,173 @@ class ParallelProcessingTester:
         try:
             async with self.session.get(f"{self.base_url}{STATUS_ENDPOINT}") as response:
                 if response.status == 200:
-                    return await response.json()
+                    return loads(await response.read())
                 else:
                     return {"error": f"Status code: {response.status}"}
         except Exception as e:
             return {"error": str(e)}
     
+    def _encode_request(self, test_data: Dict, text: str) -> bytes:
+        """
+        Build the JSON body for one request.
+        
+        The fields of TEST_DATA other than "text" are pre-serialized at import;
+        only the unique text field is encoded per request. Other payloads are
+        serialized in full each time.
+        """
+        rest_body = _TEST_DATA_REST if test_data is TEST_DATA else _encode_rest(test_data)
+        separator = b"," if rest_body != b"}" else b""
+        return b'{"text":' + dumps(text) + separator + rest_body
+    
     async def send_single_request(self, request_id: int, test_data: Dict) -> Dict[str, Any]:
-        """Send a single API request"""
-        start_time = time.time()
+        """Send a single API request, within the adaptive concurrency limit if one is set"""
+        if self.controller is None:
+            return await self._post_request(request_id, test_data)
+        
+        await self.controller.acquire()
+        result = None
+        try:
+            result = await self._post_request(request_id, test_data)
+            return result
+        finally:
+            if result is not None:
+                await self.controller.release(result["response_time"], result.get("status_code"))
+            else:
+                # Cancelled before a result: there is no latency or status to learn from
+                await self.controller.abandon()
+    
+    async def _post_request(self, request_id: int, test_data: Dict) -> Dict[str, Any]:
+        """POST one generation request and summarize the outcome"""
+        start_time = time.perf_counter()
+        retries = 0
         
         try:
             # Modify test data for uniqueness
-            modified_data = test_data.copy()
-            modified_data["text"] = f"Parallel test request #{request_id}"
-            
-            print(f"📤 Request {request_id}: Sending...")
+            body = self._encode_request(test_data, f"Parallel test request #{request_id}")
             
-            async with self.session.post(
-                f"{self.base_url}{IMAGE_ENDPOINT}",
-                json=modified_data
-            ) as response:
-                
-                response_time = time.time() - start_time
+            for attempt in range(MAX_ATTEMPTS):
+                await self.limiter.wait_if_throttled()
+                log.info(f"📤 Request {request_id}: Sending..." if attempt == 0 else f"🔁 Request {request_id}: Retry {attempt}...")
                 
-                if response.status == 200:
-                    result = await response.json()
-                    print(f"✅ Request {request_id}: Success in {response_time:.2f}s")
+                async with self.session.post(
+                    f"{self.base_url}{IMAGE_ENDPOINT}",
+                    data=body
+                ) as response:
                     
-                    return {
-                        "request_id": request_id,
-                        "status": "success",
-                        "response_time": response_time,
-                        "result": result,
-                        "image_count": len(result.get("image_variations", [])),
-                        "upscaled_count": len(result.get("upscale_image", [])),
-                        "has_excel": bool(result.get("excel_report_url")),
-                        "processing_times": result.get("metadata", {}).get("processing_times", {})
-                    }
-                else:
-                    error_text = await response.text()
-                    print(f"❌ Request {request_id}: Failed with status {response.status}")
+                    response_time = time.perf_counter() - start_time
                     
-                    return {
-                        "request_id": request_id,
-                        "status": "failed",
-                        "response_time": response_time,
-                        "error": f"HTTP {response.status}: {error_text}"
-                    }
+                    if response.status in RETRY_STATUSES and attempt < MAX_ATTEMPTS - 1:
+                        # Server is under queue pressure; back off and try again
+                        retry_after = response.headers.get("Retry-After")
+                        delay = _retry_delay(retry_after, attempt)
+                        if retry_after:
+                            # The server named a time; hold back every other request too
+                            self.limiter.pause(delay)
+                        log.info(f"⏳ Request {request_id}: HTTP {response.status}, retrying in {delay:.1f}s")
+                    elif response.status == 200:
+                        result = loads(await response.read())
+                        log.info(f"✅ Request {request_id}: Success in {response_time:.2f}s")
+                        
+                        return {
+                            "request_id": request_id,
+                            "status": "success",
+                            "status_code": response.status,
+                            "response_time": response_time,
+                            "retries": retries,
+                            "result": result,
+                            "image_count": len(result.get("image_variations", [])),
+                            "upscaled_count": len(result.get("upscale_image", [])),
+                            "has_excel": bool(result.get("excel_report_url")),
+                            "processing_times": result.get("metadata", {}).get("processing_times", {})
+                        }
+                    else:
+                        error_text = await response.text()
+                        log.info(f"❌ Request {request_id}: Failed with status {response.status}")
+                        
+                        return {
+                            "request_id": request_id,
+                            "status": "failed",
+                            "status_code": response.status,
+                            "response_time": response_time,
+                            "retries": retries,
+                            "error": f"HTTP {response.status}: {error_text}"
+                        }
+                
+                retries += 1
+                await asyncio.sleep(delay)
                     
         except Exception as e:
-            response_time = time.time() - start_time
-            print(f"💥 Request {request_id}: Exception after {response_time:.2f}s - {e}")
+            response_time = time.perf_counter() - start_time
+            log.info(f"💥 Request {request_id}: Exception after {response_time:.2f}s - {e}")
             
             return {
                 "request_id": request_id,
                 "status": "exception", 
                 "response_time": response_time,
+                "retries": retries,
                 "error": str(e)
             }
     
     async def run_concurrent_test(self, num_requests: int = 5) -> Dict[str, Any]:
         """Run multiple concurrent requests"""
-        print(f"\n🚀 Starting concurrent test with {num_requests} requests")
-        print("=" * 60)
+        # Log through the queue only while requests are in flight; stopping the
+        # listener flushes every queued line before the caller prints its report
+        listener = _start_log_listener()
+        try:
+            return await self._run_concurrent_test(num_requests)
+        finally:
+            _stop_log_listener(listener)
+    
+    async def _run_concurrent_test(self, num_requests: int) -> Dict[str, Any]:
+        """Send the requests and collect their results"""
+        log.info(f"\n🚀 Starting concurrent test with {num_requests} requests")
+        log.info("=" * 60)
+        wall_start_time = time.perf_counter()
         
         # Check initial queue status
         initial_status = await self.get_queue_status()
-        print(f"📊 Initial Queue Status: {json.dumps(initial_status, indent=2)}")
+        log.info(f"📊 Initial Queue Status: {dumps(initial_status).decode()}")
+        
+        # Warm the connection pool so the timed block measures steady-state
+        # throughput rather than one-off DNS/TCP connect cost
+        warmup_connections = min(num_requests, self.session.connector.limit_per_host)
+        await asyncio.gather(*(self.get_queue_status() for _ in range(warmup_connections)))
         
         # Send all requests concurrently
-        start_time = time.time()
+        start_time = time.perf_counter()
         tasks = [
             self.send_single_request(i, TEST_DATA) 
             for i in range(1, num_requests + 1)
         ]
         
-        # Execute all requests concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all requests concurrently, classifying each result as soon as it
+        # completes rather than waiting for the slowest request
+        buckets = {"success": [], "failed": [], "exception": []}
         
-        total_time = time.time() - start_time
+        for completed in asyncio.as_completed(tasks):
+            try:
+                result = await completed
+            except Exception as e:
+                buckets["exception"].append({"error": str(e)})
+                continue
+            buckets.get(result.get("status"), buckets["failed"]).append(result)
         
-        # Process results
-        successful_requests = []
-        failed_requests = []
+        successful_requests = buckets["success"]
+        failed_requests = buckets["failed"] + buckets["exception"]
         
-        for result in results:
-            if isinstance(result, Exception):
-                failed_requests.append({"error": str(result)})
-            elif result.get("status") == "success":
-                successful_requests.append(result)
-            else:
-                failed_requests.append(result)
+        total_time = time.perf_counter() - start_time
+        wall_time = time.perf_counter() - wall_start_time
         
         # Check final queue status
         final_status = await self.get_queue_status()
-        print(f"\n📊 Final Queue Status: {json.dumps(final_status, indent=2)}")
+        log.info(f"\n📊 Final Queue Status: {dumps(final_status).decode()}")
         
         return {
             "total_requests": num_requests,
             "successful_requests": len(successful_requests),
             "failed_requests": len(failed_requests),
             "total_time": total_time,
+            "wall_time": wall_time,
             "average_time": total_time / num_requests,
             "requests_per_second": num_requests / total_time,
             "successful_results": successful_requests,
@@ -171,24 +412,33 @@ class ParallelProcessingTester:
     
     def print_detailed_results(self, test_results: Dict[str, Any]):
         """Print detailed test results"""
+        # Bind the fields used repeatedly below once
+        total_requests = test_results['total_requests']
+        successful_results = test_results['successful_results']
+        failed_results = test_results['failed_results']
+        
         print("\n" + "=" * 80)
         print("🎯 PARALLEL PROCESSING TEST RESULTS")
         print("=" * 80)
         
         # Summary
         print(f"\n📈 SUMMARY:")
-        print(f"   Total Requests: {test_results['total_requests']}")
+        print(f"   Total Requests: {total_requests}")
         print(f"   Successful: {test_results['successful_requests']}")
         print(f"   Failed: {test_results['failed_requests']}")
-        print(f"   Success Rate: {(test_results['successful_requests'] / test_results['total_requests']) * 100:.1f}%")
-        print(f"   Total Time: {test_results['total_time']:.2f}s")
+        print(f"   Success Rate: {(test_results['successful_requests'] / total_requests) * 100:.1f}%")
+        print(f"   Total Time (steady state): {test_results['total_time']:.2f}s")
+        print(f"   Wall Time (incl. warm-up): {test_results['wall_time']:.2f}s")
         print(f"   Average Time per Request: {test_results['average_time']:.2f}s")
         print(f"   Requests per Second: {test_results['requests_per_second']:.2f}")
+        total_retries = sum(result.get('retries', 0) for result in successful_results) + \
+            sum(result.get('retries', 0) for result in failed_results)
+        print(f"   Retry Rate: {total_retries / total_requests:.2f} retries/request")
         
         # Detailed successful results
-        if test_results['successful_results']:
-            print(f"\n✅ SUCCESSFUL REQUESTS ({len(test_results['successful_results'])}):")
-            for i, result in enumerate(test_results['successful_results'], 1):
+        if successful_results:
+            print(f"\n✅ SUCCESSFUL REQUESTS ({len(successful_results)}):")
+            for i, result in enumerate(successful_results, 1):
                 print(f"   {i}. Request #{result['request_id']}")
                 print(f"      Response Time: {result['response_time']:.2f}s")
                 print(f"      Images Generated: {result['image_count']}")
@@ -196,18 +446,22 @@ class ParallelProcessingTester:
                 print(f"      Excel Report: {'✅' if result['has_excel'] else '❌'}")
                 
                 # Show processing times if available
-                if result.get('processing_times'):
-                    times = result['processing_times']
+                times = result.get('processing_times')
+                if times:
                     print(f"      Processing Breakdown:")
-                    for step, duration in times.items():
-                        if isinstance(duration, (int, float)):
-                            print(f"        {step}: {duration:.2f}s")
+                    breakdown = [
+                        f"        {step}: {duration:.2f}s"
+                        for step, duration in times.items()
+                        if isinstance(duration, (int, float))
+                    ]
+                    if breakdown:
+                        print("\n".join(breakdown))
                 print()
         
         # Failed requests
-        if test_results['failed_results']:
-            print(f"\n❌ FAILED REQUESTS ({len(test_results['failed_results'])}):")
-            for i, result in enumerate(test_results['failed_results'], 1):
+        if failed_results:
+            print(f"\n❌ FAILED REQUESTS ({len(failed_results)}):")
+            for i, result in enumerate(failed_results, 1):
                 print(f"   {i}. Request #{result.get('request_id', 'Unknown')}")
                 print(f"      Error: {result.get('error', 'Unknown error')}")
                 print(f"      Response Time: {result.get('response_time', 0):.2f}s")
@@ -234,13 +488,25 @@ class ParallelProcessingTester:
         # Check system before stress test
         initial_status = await self.get_queue_status()
         
-        # Run the test
-        start_time = time.time()
-        results = await self.run_concurrent_test(num_requests)
+        # Every request waits for a slot under an adaptive concurrency limit that
+        # starts small, opens up while responses are healthy and backs off if the
+        # server pushes back or exceeds the acceptable latency
+        controller = AIMDController(
+            c_min=1,
+            c_max=num_requests,
+            c_init=min(2, num_requests),
+            latency_target=300.0
+        )
+        self.controller = controller
+        try:
+            results = await self.run_concurrent_test(num_requests)
+        finally:
+            self.controller = None
         
         # Calculate stress test specific metrics
         results['stress_test_metrics'] = {
-            'requests_handled_concurrently': num_requests,
+            'requests_handled_concurrently': controller.peak_in_flight,
+            'final_concurrency_limit': int(controller.limit),
             'system_stability': results['successful_requests'] >= num_requests * 0.8,  # 80% success rate
             'performance_acceptable': results['average_time'] < 300,  # Less than 5 minutes average
             'queue_system_working': initial_status.get('status') == 'success'
@@ -249,28 +515,29 @@ class ParallelProcessingTester:
         return results
 
 def run_sync_test(num_requests: int = 3):
-    """Synchronous version using requests library for comparison"""
+    """Synchronous version using a pooled httpx client for comparison"""
     print(f"\n🔄 SYNCHRONOUS TEST with {num_requests} requests (for comparison)")
     
     results = []
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     for i in range(1, num_requests + 1):
-        request_start = time.time()
+        modified_data = TEST_DATA.copy()
+        modified_data["text"] = f"Sync test request #{i}"
+        
+        print(f"📤 Sync Request {i}: Sending...")
+        
+        # Time only the request/response, not payload preparation
+        request_start = time.perf_counter()
         
         try:
-            modified_data = TEST_DATA.copy()
-            modified_data["text"] = f"Sync test request #{i}"
-            
-            print(f"📤 Sync Request {i}: Sending...")
-            
-            response = requests.post(
+            response = _get_sync_client().post(
                 f"{BASE_URL}{IMAGE_ENDPOINT}",
                 json=modified_data,
                 timeout=600
             )
             
-            request_time = time.time() - request_start
+            request_time = time.perf_counter() - request_start
             
             if response.status_code == 200:
                 print(f"✅ Sync Request {i}: Success in {request_time:.2f}s")
@@ -288,7 +555,7 @@ def run_sync_test(num_requests: int = 3):
                 })
                 
         except Exception as e:
-            request_time = time.time() - request_start
+            request_time = time.perf_counter() - request_start
             print(f"💥 Sync Request {i}: Exception - {e}")
             results.append({
                 "request_id": i,
@@ -297,7 +564,7 @@ def run_sync_test(num_requests: int = 3):
                 "error": str(e)
             })
     
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
     
     successful = len([r for r in results if r['status'] == 'success'])
     print(f"\n📊 Synchronous Test Results:")
@@ -326,23 +593,30 @@ async def main():
         # Show stress test specific results
         stress_metrics = stress_results.get('stress_test_metrics', {})
         print(f"\n💪 STRESS TEST ANALYSIS:")
+        print(f"   Peak Concurrency: {stress_metrics.get('requests_handled_concurrently')} "
+              f"(final limit {stress_metrics.get('final_concurrency_limit')})")
         print(f"   System Stability: {'✅ PASS' if stress_metrics.get('system_stability') else '❌ FAIL'}")
         print(f"   Performance Acceptable: {'✅ PASS' if stress_metrics.get('performance_acceptable') else '❌ FAIL'}")
         print(f"   Queue System Working: {'✅ PASS' if stress_metrics.get('queue_system_working') else '❌ FAIL'}")
     
     # Test 3: Synchronous comparison (optional)
     print("\n🎯 Test 3: Synchronous Comparison")
-    sync_results = run_sync_test(2)
+    try:
+        sync_results = run_sync_test(2)
+    finally:
+        if _SYNC_CLIENT is not None:
+            _SYNC_CLIENT.close()
     
     print("\n🎉 All tests completed!")
 
 if __name__ == "__main__":
+    setup_logging()
     print("🚀 Starting Fashion AI Parallel Processing Tests...")
     print("💡 Make sure the server is running: python -m uvicorn app.main:app --reload")
     print()
     
     try:
-        asyncio.run(main())
+        run_async(main())
     except KeyboardInterrupt:
         print("\n🛑 Tests interrupted by user")
     except Exception as e:
@@ -11,9 +11,9 @@ import random
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.services.image_generator import ImageGenerator
+from tests._generator import get_generator
 
-def test_pose_selection():
+def test_pose_selection(generator):
     """Test the pose selection functionality"""
     print("Testing pose selection functionality...")
     
@@ -38,48 +38,32 @@ def test_pose_selection():
         "Key Features": ["lightweight fabric", "flowing skirt", "v-neck"]
     }
     
-    # Initialize the image generator
-    generator = ImageGenerator()
-    
     # Test pose selection with recommendations
     print("\n1. Testing pose selection with recommendations...")
+    num_trials = 5  # With the seed below, these trials draw all three recommended poses
+    recommended_poses = product_data_with_poses['RecommendedPoses']
+    
+    # Seed the module-level RNG the generator draws from so runs are reproducible
+    random.seed(42)
     poses_selected = []
-    for i in range(5):  # Test multiple times to see randomness
-        # Mock the _create_generation_prompt method to just return the pose
-        background = "elegant ballroom with chandeliers"
-        aspect_ratio = "9:16"
-        gender = "women"
-        
-        # Get pose recommendation if available
-        pose_recommendations = product_data_with_poses.get('RecommendedPoses', [])
-        if pose_recommendations:
-            # Randomly select one of the recommended poses for variety
-            pose = random.choice(pose_recommendations)
-        else:
-            pose = "standing straight with confident, natural posture showcasing the outfit"
-        
-        poses_selected.append(pose)
-        print(f"  Selected pose {i+1}: {pose}")
+    for i in range(1, num_trials + 1):
+        prompt = generator._create_generation_prompt(product_data_with_poses, "elegant wedding venue")
+        matched = [pose for pose in recommended_poses if pose in prompt]
+        assert len(matched) == 1, f"Expected exactly one recommended pose in prompt {i}, found {len(matched)}"
+        poses_selected.append(matched[0])
+        print(f"  Selected pose {i}: {matched[0]}")
     
-    # Check if different poses were selected (indicating randomness is working)
+    # The generator should vary the pose rather than always using the same one
     unique_poses = set(poses_selected)
     print(f"  Unique poses selected: {len(unique_poses)} out of {len(poses_selected)} trials")
+    assert len(unique_poses) > 1, "Pose selection always picked the same recommended pose"
     
     # Test pose selection without recommendations
     print("\n2. Testing pose selection without recommendations...")
-    background = "casual cafe setting"
-    aspect_ratio = "9:16"
-    gender = "women"
-    
-    # Get pose recommendation if available
-    pose_recommendations = product_data_without_poses.get('RecommendedPoses', [])
-    if pose_recommendations:
-        # Randomly select one of the recommended poses for variety
-        pose = random.choice(pose_recommendations)
-    else:
-        pose = "standing straight with confident, natural posture showcasing the outfit"
-    
-    print(f"  Default pose selected: {pose}")
+    default_pose = "standing straight with confident, natural posture showcasing the outfit"
+    prompt = generator._create_generation_prompt(product_data_without_poses, "casual cafe setting")
+    assert default_pose in prompt, "Default pose missing when no poses are recommended"
+    print(f"  Default pose selected: {default_pose}")
 
 if __name__ == "__main__":
-    test_pose_selection()
\ No newline at end of file
+    test_pose_selection(get_generator())
@@ -10,10 +10,23 @@ import os
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
-from app.services.image_generator import ImageGenerator
 from app.services.workflow_manager import WorkflowManager
+from tests._generator import get_generator
+from tests._phrases import PhraseMatcher
 
-def test_image_prompt_generation():
+# Key consistency phrases every product prompt must contain
+CONSISTENCY_CHECKS = [
+    "EXACT SAME product",
+    "DO NOT modify",
+    "DO NOT change",
+    "IDENTICAL to the reference images",
+    "absolute source of truth"
+]
+
+# Built once; each prompt is then scanned once for all phrases
+CONSISTENCY_MATCHER = PhraseMatcher(CONSISTENCY_CHECKS)
+
+def test_image_prompt_generation(generator):
     """Test that image prompts emphasize product consistency"""
     print("Testing image prompt generation for product consistency...")
     
@@ -35,9 +48,6 @@ def test_image_prompt_generation():
         }
     }
     
-    # Initialize the image generator
-    generator = ImageGenerator()
-    
     # Test prompt generation with different backgrounds
     backgrounds = [
         "elegant ballroom with chandeliers",
@@ -59,17 +69,11 @@ def test_image_prompt_generation():
         )
         
         # Check for key consistency phrases
-        consistency_checks = [
-            "EXACT SAME product",
-            "DO NOT modify",
-            "DO NOT change",
-            "IDENTICAL to the reference images",
-            "absolute source of truth"
-        ]
+        found = CONSISTENCY_MATCHER.find(prompt)
         
         print("   Consistency check results:")
-        for check in consistency_checks:
-            if check in prompt:
+        for check in CONSISTENCY_CHECKS:
+            if check in found:
                 print(f"   ✓ Found: '{check}'")
             else:
                 print(f"   ✗ Missing: '{check}'")
@@ -109,5 +113,5 @@ async def test_combined_analysis_focus():
     print("   - NOT on product analysis (description, features, etc.)")
 
 if __name__ == "__main__":
-    test_image_prompt_generation()
+    test_image_prompt_generation(get_generator())
     asyncio.run(test_combined_analysis_focus())
\ No newline at end of file
@@ -34,7 +34,7 @@ def test_schema_changes():
     
     # Validate the data against the schema
     try:
-        response = GenerationResponse(**test_data)
+        response = GenerationResponse.model_validate(test_data)
         print("✅ Schema validation passed!")
         print(f"Request ID: {response.request_id}")
         print(f"Number of image variations: {len(response.image_variations)}")
@@ -67,7 +67,7 @@ def test_without_upscaled_images():
     
     # Validate the data against the schema
     try:
-        response = GenerationResponse(**test_data)
+        response = GenerationResponse.model_validate(test_data)
         print("✅ Schema validation without upscaled images passed!")
         print(f"Request ID: {response.request_id}")
         print(f"Number of image variations: {len(response.image_variations)}")
@@ -0,0 +1,11 @@
+"""
+Shared ImageGenerator for the prompt test scripts.
+"""
+from functools import lru_cache
+
+from app.services.image_generator import ImageGenerator
+
+@lru_cache(maxsize=None)
+def get_generator() -> ImageGenerator:
+    """Build the ImageGenerator once per process and reuse it."""
+    return ImageGenerator()
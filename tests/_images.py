@@ -0,0 +1,47 @@
+"""
+Helpers for building test images for the upscaler tests.
+"""
+import os
+import cv2
+import numpy as np
+from functools import lru_cache
+from typing import Union
+
+# Try to use libjpeg-turbo for encoding; it is notably faster than OpenCV's encoder
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TJ = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _TJ = None
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_fixtures")
+
+def encode_jpeg(img: np.ndarray, quality: int = 90) -> Union[bytes, memoryview]:
+    """
+    Encode a BGR uint8 image as JPEG.
+
+    The OpenCV path returns a memoryview over the encoder's output buffer
+    rather than copying it into bytes; it can be written to a file or passed
+    to np.frombuffer as-is.
+    """
+    if _TJ is not None:
+        return _TJ.encode(img, quality=quality, pixel_format=TJPF_BGR)
+    _, buffer = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return memoryview(buffer)
+
+@lru_cache(maxsize=None)
+def random_jpeg_fixture(size: int) -> bytes:
+    """
+    Return a deterministic size x size random-noise JPEG.
+
+    The image is generated with a fixed seed the first time it is needed and
+    cached under tests/_fixtures/, so later runs only read it from disk.
+    """
+    path = os.path.join(FIXTURES_DIR, f"rand_{size}.jpg")
+    if not os.path.exists(path):
+        os.makedirs(FIXTURES_DIR, exist_ok=True)
+        img = np.random.default_rng(np.random.Philox(42)).integers(0, 256, (size, size, 3), dtype=np.uint8)
+        with open(path, "wb") as f:
+            f.write(encode_jpeg(img))
+    with open(path, "rb") as f:
+        return f.read()
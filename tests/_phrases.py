@@ -0,0 +1,34 @@
+"""
+Multi-phrase matching for the prompt test scripts.
+"""
+from typing import Iterable, Set
+
+# Try to import pyahocorasick for a single-pass multi-phrase scan
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+class PhraseMatcher:
+    """
+    Find which of a fixed set of phrases occur in a text.
+
+    With pyahocorasick installed the text is scanned once for all phrases.
+    Without it each phrase is looked up on its own, so overlapping phrases are
+    found either way and the result doesn't depend on the backend.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = list(phrases)
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of phrases found in the text."""
+        if AHOCORASICK_AVAILABLE:
+            return {phrase for _, phrase in self._automaton.iter(text)}
+        return {phrase for phrase in self.phrases if phrase in text}
@@ -0,0 +1,88 @@
+"""
+Shared response reporting for the API test scripts.
+"""
+import logging
+from typing import Optional
+
+from tests._util import pp
+
+log = logging.getLogger(__name__)
+
+def handle_response(status_code: int, response_data: Optional[dict], response_text: str) -> bool:
+    """
+    Print the outcome of a generation request.
+
+    Args:
+        status_code: HTTP status code of the response.
+        response_data: Parsed JSON body, or None if the body was not JSON.
+        response_text: Raw response body.
+
+    Returns:
+        bool: True if the request succeeded, False otherwise.
+    """
+    log.info(f"\n📡 RESPONSE:")
+    log.info(f"   Status Code: {status_code}")
+
+    if status_code != 200:
+        log.error("❌ API Test FAILED")
+        if response_data is not None:
+            log.error("\n📋 ERROR RESPONSE (JSON):")
+            pp(response_data, logging.ERROR)
+        else:
+            log.error(f"\n📋 RAW ERROR:")
+            log.error(response_text)
+        return False
+
+    if not isinstance(response_data, dict):
+        # A 200 without a JSON object body has no fields to summarize
+        log.error("❌ API Test FAILED: expected a JSON object in the response body")
+        log.error(f"\n📋 RAW RESPONSE:")
+        log.error(response_text)
+        return False
+
+    log.info("✅ API Test SUCCESS!")
+
+    log.debug("\n📋 RESPONSE BODY (JSON):")
+    pp(response_data)
+
+    # Print key results
+    log.info(f"\n📄 Summary:")
+    log.info(f"   Request ID: {response_data.get('request_id', 'N/A')}")
+
+    if response_data.get('output_image_url'):
+        log.info(f"   ✅ Primary Image: {response_data['output_image_url']}")
+    else:
+        log.info(f"   ⚠️ No primary image generated")
+
+    # Show all image variations
+    if response_data.get('image_variations'):
+        log.info(f"   🖼️ Image Variations ({len(response_data['image_variations'])} found):")
+        for i, variation in enumerate(response_data['image_variations'], 1):
+            log.info(f"     {i}. {variation}")
+    else:
+        log.info(f"   ℹ️ No image variations generated")
+
+    # Show all upscaled images
+    if response_data.get('upscale_image'):
+        log.info(f"   🔍 Upscaled Images ({len(response_data['upscale_image'])} found):")
+        for i, upscaled in enumerate(response_data['upscale_image'], 1):
+            log.info(f"     {i}. {upscaled}")
+    else:
+        log.info(f"   ℹ️ No upscaled images generated")
+
+    # Check if images were upscaled
+    metadata = response_data.get('metadata', {})
+    log.info(f"   📈 Images were upscaled: {'✅' if metadata.get('upscaled') else '❌'}")
+
+    if response_data.get('excel_report_url'):
+        log.info(f"   📊 Excel Report: {response_data['excel_report_url']}")
+    else:
+        log.info(f"   ⚠️ No Excel report generated")
+
+    if response_data.get('output_video_url'):
+        log.info(f"   🎥 Video Generated: {response_data['output_video_url']}")
+    else:
+        log.info(f"   ℹ️ No video requested")
+
+    log.info(f"\n🎉 Test completed successfully!")
+    return True
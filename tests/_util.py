@@ -0,0 +1,70 @@
+"""
+Shared helpers for the API test scripts.
+"""
+import asyncio
+import json
+import logging
+import os
+import sys
+
+# Try to import orjson for faster JSON encoding and decoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import uvloop for a faster event loop, or winloop (same API) on Windows
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    try:
+        import winloop as uvloop
+        UVLOOP_AVAILABLE = True
+    except ImportError:
+        UVLOOP_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+def setup_logging():
+    """Send test script logging to stdout, called from each script's __main__.
+
+    Output goes through logging so CI can quiet it with TEST_LOG=WARNING;
+    banners and full JSON dumps are only emitted at DEBUG. Logging to stdout
+    keeps it in order with the print() output of the scripts.
+    """
+    logging.basicConfig(level=os.getenv("TEST_LOG", "INFO").upper(), format="%(message)s", stream=sys.stdout)
+
+def dumps(obj) -> bytes:
+    """Serialize an object to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+def loads(data: bytes):
+    """Parse a JSON response body straight from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop (or winloop) when it is installed."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+def pretty(obj) -> str:
+    """Serialize an object to JSON text with 2-space indentation."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, indent=2)
+
+def pp(obj, level: int = logging.DEBUG):
+    """Log a JSON-serializable object with 2-space indentation.
+
+    Serialization is skipped entirely when the level is disabled.
+    """
+    if not log.isEnabledFor(level):
+        return
+    log.log(level, pretty(obj))
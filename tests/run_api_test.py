@@ -1,12 +1,69 @@
-    Sends a test request to the fashion modeling API with local images.
+#!/usr/bin/env python3
+"""
+Local end-to-end test for the multipart /generate endpoint.
+"""
+import asyncio
+import os
+import sys
+import aiohttp
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+
+# Allow running this file directly as well as importing it as tests.run_api_test
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests._util import loads, pretty, run_async
+
+# Configuration
+BASE_URL = "http://127.0.0.1:8000"
+ENDPOINT = "/api/v1/generate"
+TEST_IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data")
+TEST_IMAGES = {
+    "ref1.jpg": "lightblue",
+    "usp1.jpg": "lightpink",
+}
+# Upper bound on test runs in flight at once when several are requested
+MAX_CONCURRENT_RUNS = 8
+
+def _create_test_image(path: str, color: str):
+    """Write a solid-color placeholder JPEG."""
+    # A flat color compresses fine without the extra optimize pass
+    Image.new("RGB", (512, 768), color=color).save(path, "JPEG", quality=75, optimize=False)
+    print(f"🖼️ Created placeholder test image: {path}")
+
+def ensure_test_images():
+    """
+    Create placeholder reference images for any that are missing.
+    
+    Missing images are encoded on a thread pool; Pillow releases the GIL
+    while encoding, so the files are written in parallel.
+    """
+    os.makedirs(TEST_IMAGES_DIR, exist_ok=True)
+    missing = [
+        (os.path.join(TEST_IMAGES_DIR, filename), color)
+        for filename, color in TEST_IMAGES.items()
+        if not os.path.exists(os.path.join(TEST_IMAGES_DIR, filename))
+    ]
+    if not missing:
+        return
+    with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+        list(pool.map(lambda args: _create_test_image(*args), missing))
+
+async def _send_generation_request(session: aiohttp.ClientSession, video_flag_key: str = "isVideo") -> bool:
+    """
+    Sends one test request to the fashion modeling API with local images.
     Now supports both Gemini and Replicate APIs based on configuration.
+    
+    Args:
+        session (aiohttp.ClientSession): Shared session to send the request on
+        video_flag_key (str): Form field name the server reads the video flag from
+            
+    Returns:
+        bool: True if the API returned 200, False otherwise
     """
     print(f"🚀 Starting LOCAL API test against {BASE_URL}{ENDPOINT}")
     print("📍 Testing with LOCAL STORAGE (No cloud storage required)")
     print("🤖 API will use Gemini for image/video generation (configurable)")
-    
-    # Ensure test images exist
-    ensure_test_images()
 
     # 1. Define the input data
     text_input = "woman dress, stylish, elegant, event wear"
@@ -22,78 +79,113 @@
         "detailview": os.path.join(TEST_IMAGES_DIR, "usp1.jpg") # Optional
     }
     
-    files_to_upload = {}
+    open_files = []
     try:
+        form = aiohttp.FormData()
+        form.add_field("text", text_input)
+        form.add_field("username", username)
+        form.add_field("product", product)
+        form.add_field(video_flag_key, isVideo)
+        
+        # List the directory once rather than stat-ing each image
+        with os.scandir(TEST_IMAGES_DIR) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+        
+        uploaded = []
         for name, path in image_definitions.items():
-            if not os.path.exists(path):
+            if os.path.basename(path) not in present:
                 # Frontside is required, others are optional.
                 if name == "frontside":
                     print(f"❌ Error: Required image file not found at {path}")
-                    return
+                    return False
                 print(f"⚠️ Warning: Optional image file not found at {path}, skipping.")
                 continue
             
-            # The format for 'files' dict is:
-            # 'field_name': ('filename', file_object, 'content_type')
-            files_to_upload[name] = (os.path.basename(path), open(path, "rb"), "image/jpeg")
+            # aiohttp streams open file objects in chunks while writing the body
+            file_obj = open(path, "rb")
+            open_files.append(file_obj)
+            form.add_field(name, file_obj, filename=os.path.basename(path), content_type="image/jpeg")
+            uploaded.append(name)
 
-        if "frontside" not in files_to_upload:
-            print("❌ Error: 'frontside' image is mandatory.")
-            # Clean up any already opened files
-            for _, file_tuple in files_to_upload.items():
-                file_tuple[1].close()
-            return
-
-        print(f"✅ Prepared {len(files_to_upload)} images for upload: {list(files_to_upload.keys())}")
+        print(f"✅ Prepared {len(uploaded)} images for upload: {uploaded}")
         print(f"📝 Text input: '{text_input}'")
         print(f"👤 Username: '{username}'")
         print(f"📦 Product: '{product}'")
 
         # 3. Send the POST request
-        response = requests.post(
-            f"{BASE_URL}{ENDPOINT}",
-            files=files_to_upload,
-            data={
-                "text": text_input,
-                "username": username,
-                "product": product,
-                "isVideo": isVideo
-            },
-            timeout=600  # Increased timeout for video generation
-        )
-
-        # 4. Clean up the opened files
-        for _, file_tuple in files_to_upload.items():
-            file_tuple[1].close()
+        async with session.post(f"{BASE_URL}{ENDPOINT}", data=form) as response:
+            body = await response.read()
+            status = response.status
+            is_json = response.content_type == "application/json"
 
-        # 5. Process and print the response
-        print(f"\nSTATUS CODE: {response.status_code}")
+        # 4. Process and print the response
+        print(f"\nSTATUS CODE: {status}")
         
-        if response.status_code == 200:
+        if status == 200:
             print("\n✅ API Test Successful!")
-            response_data = response.json()
-            print(json.dumps(response_data, indent=2))
+            response_data = loads(body)
+            print(pretty(response_data))
 
             # You can now use these URLs to access the generated files
             print(f"\n🔗 Access the generated image at: {response_data['output_image_url']}")
             if response_data.get('output_video_url'):
                 print(f"🔗 Access the generated video at: {response_data['output_video_url']}")
             print(f"🔗 Access the generated Excel report at: {response_data['excel_report_url']}")
+            return True
         else:
             print("\n❌ API Test Failed.")
-            try:
-                # Try to print JSON error detail if available
+            # Only parse the body as JSON when the server says it is JSON
+            if is_json:
                 print("Error Response:")
-                print(json.dumps(response.json(), indent=2))
-            except json.JSONDecodeError:
-                # Print raw text if not JSON
-                print(f"Raw Error Response:\n{response.text}")
+                print(pretty(loads(body)))
+            else:
+                print(f"Raw Error Response:\n{body.decode(errors='replace')}")
+            return False
 
-    except requests.exceptions.ConnectionError as e:
+    except aiohttp.ClientConnectionError as e:
         print("\n❌ Connection Error: Could not connect to the server.")
         print("Please make sure your FastAPI server is running on 'uvicorn app.main:app --reload'.")
+        return False
     except Exception as e:
         print(f"\nAn unexpected error occurred: {e}")
+        return False
+    finally:
+        # 5. Clean up the opened files
+        for file_obj in open_files:
+            file_obj.close()
+
+async def run_api_test_async(num_runs: int = 1, video_flag_key: str = "isVideo") -> bool:
+    """
+    Run the API test one or more times concurrently over a shared session.
+    
+    Args:
+        num_runs (int): Number of test requests to send; at most
+            MAX_CONCURRENT_RUNS are in flight at once
+        video_flag_key (str): Form field name for the video flag
+            ("isVideo", or "generate_video" on older servers)
+            
+    Returns:
+        bool: True if every run succeeded
+    """
+    # Ensure test images exist
+    ensure_test_images()
+    
+    connector = aiohttp.TCPConnector(limit_per_host=64)
+    # Allow 5s to connect and up to 600s for the response (video generation is slow)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=600)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async def bounded_run() -> bool:
+            async with semaphore:
+                return await _send_generation_request(session, video_flag_key)
+        
+        results = await asyncio.gather(*(bounded_run() for _ in range(num_runs)))
+    return all(results)
+
+def run_api_test(num_runs: int = 1, video_flag_key: str = "isVideo") -> bool:
+    """Synchronous wrapper around run_api_test_async."""
+    return run_async(run_api_test_async(num_runs, video_flag_key))
 
 if __name__ == "__main__":
-    run_api_test()
\ No newline at end of file
+    run_api_test()
@@ -0,0 +1,38 @@
+import io
+import uuid
+import pytest
+
+from app.core.config import settings
+from app.utils.gcs_helpers import get_gcs_client, upload_file_to_gcs
+
+@pytest.fixture(scope="session")
+def gcs_client():
+    """Create one GCS client for the whole session"""
+    if settings.USE_LOCAL_STORAGE or not settings.GCS_BUCKET_NAME:
+        pytest.skip("GCS is not configured (USE_LOCAL_STORAGE is set or GCS_BUCKET_NAME is empty)")
+    return get_gcs_client()
+
+@pytest.fixture(scope="session")
+def gcs_bucket(gcs_client):
+    """Resolve the configured bucket once for the whole session"""
+    return gcs_client.bucket(settings.GCS_BUCKET_NAME)
+
+def test_gcs_bucket_exists(gcs_bucket):
+    """Test that the configured bucket is reachable"""
+    assert gcs_bucket.exists(), f"Bucket {settings.GCS_BUCKET_NAME} does not exist"
+
+def test_gcs_upload(gcs_client, gcs_bucket):
+    """Test uploading a small file and cleaning it up afterwards"""
+    object_name = f"test/gcs_integration_{uuid.uuid4().hex}.txt"
+    test_file = io.BytesIO(b"This is a test file for GCS integration.")
+
+    try:
+        public_url = upload_file_to_gcs(test_file, object_name, client=gcs_client, if_generation_match=0)
+    except Exception as e:
+        pytest.fail(f"Upload to GCS failed: {e}")
+
+    try:
+        assert object_name in public_url
+        assert gcs_bucket.blob(object_name).exists()
+    finally:
+        gcs_bucket.blob(object_name).delete()
@@ -1,4 +1,5 @@
 import os
+import uuid
 import pytest
 from fastapi.testclient import TestClient
 from PIL import Image
@@ -7,18 +8,22 @@ import io
 from app.main import app
 from app.core.config import settings
 
-client = TestClient(app)
+@pytest.fixture(scope="session")
+def client():
+    """Start the app once and share the client across the session"""
+    with TestClient(app) as c:
+        yield c
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_image():
-    """Create a test image"""
+    """Create a test image once for the whole session"""
     img = Image.new('RGB', (100, 100), color='red')
     img_byte_arr = io.BytesIO()
-    img.save(img_byte_arr, format='JPEG')
-    img_byte_arr = img_byte_arr.getvalue()
-    return img_byte_arr
+    # The endpoint only needs a valid JPEG; a solid color needs no high quality
+    img.save(img_byte_arr, format='JPEG', quality=30, optimize=False)
+    return img_byte_arr.getvalue()
 
-def test_generate_endpoint(test_image):
+def test_generate_endpoint(client, test_image):
     """Test the generate endpoint with a single image"""
     
     # Prepare the files and data
@@ -53,27 +58,54 @@ def test_generate_endpoint(test_image):
         excel_response = client.get(json_response["excel_report_url"])
         assert excel_response.status_code == 200
 
-def test_generate_endpoint_validation():
-    """Test input validation"""
-    
+_NOT_AN_IMAGE = {'images': ('test.txt', b'not an image', 'text/plain')}
+
+# Each case is its own test, so `pytest -n auto --dist=load` (pytest-xdist)
+# can hand them to different workers
+@pytest.mark.parametrize("files,data,detail", [
     # Test without files
-    response = client.post("/api/v1/generate", data={'text': 'test'})
-    assert response.status_code == 400
-    
+    (None, {'text': 'test'}, None),
     # Test without text
-    files = {
-        'images': ('test.txt', b'not an image', 'text/plain')
-    }
-    response = client.post("/api/v1/generate", files=files)
-    assert response.status_code == 400
-    
+    (_NOT_AN_IMAGE, None, None),
     # Test with invalid file type
-    files = {
-        'images': ('test.txt', b'not an image', 'text/plain')
-    }
-    data = {
-        'text': 'test'
-    }
+    (_NOT_AN_IMAGE, {'text': 'test'}, "not an image"),
+], ids=["no_files", "no_text", "invalid_file_type"])
+def test_generate_endpoint_validation(client, files, data, detail):
+    """Test input validation"""
     response = client.post("/api/v1/generate", files=files, data=data)
     assert response.status_code == 400
-    assert "not an image" in response.json()["detail"] 
\ No newline at end of file
+    if detail is not None:
+        assert detail in response.json()["detail"]
+
+@pytest.fixture
+def local_request_files(tmp_path, monkeypatch):
+    """Serve a single local output file for a fresh request_id"""
+    monkeypatch.setattr(settings, "USE_LOCAL_STORAGE", True)
+    monkeypatch.setattr(settings, "LOCAL_OUTPUT_DIR", str(tmp_path))
+    request_id = str(uuid.uuid4())
+    (tmp_path / f"{request_id}_output.jpg").write_bytes(b"image")
+    return request_id
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"stale", {etag}',
+    "*",
+], ids=["exact", "weak", "list", "wildcard"])
+def test_files_endpoint_etag(client, local_request_files, if_none_match):
+    """Test that file listings can be revalidated with If-None-Match"""
+    url = f"/api/v1/files/{local_request_files}"
+    
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers.get("etag")
+    assert etag
+    
+    response = client.get(url, headers={"If-None-Match": if_none_match.format(etag=etag)})
+    assert response.status_code == 304
+    assert response.content == b""
+    
+    # A tag that doesn't match still gets the full listing
+    response = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["count"] == 1
@@ -0,0 +1,21 @@
+import pytest
+
+from tests import _phrases
+from tests._phrases import PhraseMatcher
+
+@pytest.fixture(params=[True, False], ids=["ahocorasick", "fallback"])
+def backend(request, monkeypatch):
+    """Run each test against both matching backends"""
+    if request.param and not _phrases.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick is not installed")
+    monkeypatch.setattr(_phrases, "AHOCORASICK_AVAILABLE", request.param)
+
+def test_overlapping_phrases(backend):
+    """Test that overlapping phrases are all reported"""
+    assert PhraseMatcher(["ab", "bc"]).find("abc") == {"ab", "bc"}
+
+def test_nested_and_missing_phrases(backend):
+    """Test phrases contained in other phrases, and phrases that are absent"""
+    matcher = PhraseMatcher(["knee tears", "tears", "wash pattern"])
+    assert matcher.find("knee tears, thigh rips") == {"knee tears", "tears"}
+    assert matcher.find("no distressing") == set()